@@ -12,14 +12,18 @@ import re
 import os
 import time
 import threading
-import fnmatch
 import tempfile
 import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
-from collections import defaultdict
+from collections import defaultdict, Counter
+from operator import itemgetter
 import argparse
+import functools
+import hashlib
 import html
+import shlex
 import urllib.parse
 
 # Try to import tqdm for better progress bars
@@ -30,6 +34,20 @@ except ImportError:
     TQDM_AVAILABLE = False
     print("Note: Install 'tqdm' for better progress bars: pip install tqdm")
 
+# Try to import ijson to stream large compile_commands.json files
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Try to import orjson for faster JSON parsing
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 class PrintMode:
     """Print mode constants"""
     QUIET = 'quiet'
@@ -37,6 +55,318 @@ class PrintMode:
     VERBOSE = 'verbose'
     FULL = 'full'
 
+DEFAULT_CACHE_DIR = os.path.join('~', '.cache', 'clang_tidy_full_report')
+
+# In large Markdown reports, files with fewer issues are listed in the index
+# instead of getting a page of their own
+MARKDOWN_FILE_REPORT_MIN_ISSUES = 5
+
+# Per-file report pages are only built in worker processes for at least this
+# many warnings; below it, pickling them costs more than it saves
+FILE_REPORT_POOL_MIN_WARNINGS = 20000
+
+# Write buffer for large report files, so they go out in a few big writes
+REPORT_BUFFER_SIZE = 1 << 22
+
+# ccache log lines start with "[<timestamp> <pid>]"; lines of one compilation share the pid
+CCACHE_LOG_RE = re.compile(r'^\[\S+ (\d+)[^\]]*\] (Working directory|Source file|Result): (.*)$')
+
+# Extensions counted as header files in the summary
+HEADER_EXTENSIONS = frozenset({'.h', '.hpp', '.hxx', '.hh'})
+
+# Source file named by a run-clang-tidy output line, in order of preference: a
+# diagnostic location, a path after "Processing"/"Analyzing", or a leading path
+_SOURCE_EXT = r'\.(?:cpp|cc|cxx|c|h|hpp|hxx)'
+PARALLEL_FILE_RE = re.compile(
+    r'^(?P<diag>[^:\n]+' + _SOURCE_EXT + r'):\d+:\d+:'
+    r'|^.*?(?:rocessing|nalyzing).*?(?<!\S):*(?P<proc>\S*/\S*' + _SOURCE_EXT + r')(?!\S)'
+    r'|^(?P<path>[^\s/]*/\S*' + _SOURCE_EXT + r')(?!\S)')
+
+# HTML for one warning, filled via format_map with the warning dict plus message_esc
+_DETAIL_TMPL = '''
+            <div class="{severity}" style="margin: 10px 0; padding: 10px; border-left: 4px solid;">
+                <div style="color: #6c757d; font-size: 14px;">Line {line}, Column {column}</div>
+                <div>{message_esc}</div>
+                <span class="check-badge">{check}</span>
+            </div>
+'''
+_FILE_DETAIL_TMPL = '''
+            <div class="{severity}">
+                <div class="location">Column {column}</div>
+                <div class="message">{message_esc}</div>
+                <span class="check-name">{check}</span>
+            </div>
+'''
+
+def _available_cpus():
+    """Number of CPU cores this process may run on (respects taskset/cgroup affinity)"""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        # sched_getaffinity is not available on Windows and macOS
+        return multiprocessing.cpu_count()
+
+def _default_jobs():
+    """Default number of parallel clang-tidy processes (2/3 of available CPU cores)"""
+    return max(1, int(_available_cpus() * 2 / 3))
+
+@functools.lru_cache(maxsize=None)
+def _display_path(file_path, project_dir):
+    """Compute a display path once per (path, project dir); see ClangTidyReporter._get_display_path"""
+    if project_dir:
+        try:
+            abs_path = os.path.abspath(file_path)
+            if abs_path.startswith(project_dir):
+                return os.path.relpath(abs_path, project_dir)
+        except:
+            pass
+    
+    # Fall back to relative path from cwd
+    try:
+        return os.path.relpath(file_path)
+    except:
+        return file_path
+
+class _SafeNameTable(dict):
+    r"""str.translate table keeping word characters and '-', mapping anything else to '_'
+
+    Entries are filled in on first use, so non-ASCII word characters are kept
+    just like with re.sub(r'[^\w\-]', '_', ...).
+    """
+    def __missing__(self, codepoint):
+        char = chr(codepoint)
+        value = self[codepoint] = char if re.match(r'[\w\-]', char) else '_'
+        return value
+
+_SAFE_NAME_TABLE = _SafeNameTable()
+
+@functools.lru_cache(maxsize=None)
+def _safe_filename(file_path):
+    """File name fragment for a source file's separate report page"""
+    return file_path.translate(_SAFE_NAME_TABLE)
+
+@functools.lru_cache(maxsize=None)
+def _make_anchor(text):
+    """Compute an HTML anchor once per path; see ClangTidyReporter._make_anchor"""
+    return text.translate(_SAFE_NAME_TABLE)
+
+# Paths and messages repeat across many warnings, escape each distinct one once
+_escape_html = functools.lru_cache(maxsize=None)(html.escape)
+
+def _preprocess_args(entry):
+    """Turn a compile_commands.json entry into a command printing the preprocessed source
+
+    Output and dependency-file options are dropped so that nothing is written
+    to the build tree.
+    """
+    args = list(entry['arguments']) if 'arguments' in entry else shlex.split(entry['command'])
+    result = args[:1]
+    skip_next = False
+    for arg in args[1:]:
+        if skip_next:
+            skip_next = False
+        elif arg in ('-o', '-MF', '-MT', '-MQ'):
+            skip_next = True
+        elif arg in ('-c', '-MD', '-MMD') or (arg.startswith('-o') and not arg.startswith('-obj')):
+            continue
+        else:
+            result.append(arg)
+    return result + ['-E']
+
+def _existing_files(paths):
+    """Return the subset of paths that are existing files
+
+    Reads each parent directory once with os.scandir instead of calling
+    stat for every path, except for directories that cannot be listed.
+    """
+    names_by_dir = defaultdict(set)
+    for path in paths:
+        names_by_dir[os.path.dirname(path)].add(os.path.basename(path))
+    
+    existing = set()
+    for directory, names in names_by_dir.items():
+        try:
+            with os.scandir(directory or '.') as entries:
+                for entry in entries:
+                    if entry.name in names and entry.is_file():
+                        existing.add(os.path.join(directory, entry.name))
+        except PermissionError:
+            # Directories that can be traversed but not listed still allow stat
+            existing.update(path for path in (os.path.join(directory, name) for name in names)
+                            if os.path.exists(path))
+        except OSError:
+            pass
+    return existing
+
+def _argv_batches(args, reserved=0):
+    """Split args into lists that each fit on one command line
+
+    reserved is the length of the fixed part of the command. The limit is
+    taken from SC_ARG_MAX minus the environment, halved for safety.
+    """
+    try:
+        arg_max = os.sysconf('SC_ARG_MAX')
+    except (AttributeError, ValueError, OSError):
+        # No sysconf on Windows, whose command lines are limited to 32K characters
+        arg_max = 32767
+    env_size = sum(len(key) + len(value) + 2 for key, value in os.environ.items())
+    budget = max(4096, (arg_max - env_size) // 2 - reserved)
+    
+    batches = [[]]
+    size = 0
+    for arg in args:
+        # Each argument also costs a terminating NUL and a pointer in argv
+        arg_size = len(arg) + 1 + 8
+        if batches[-1] and size + arg_size > budget:
+            batches.append([])
+            size = 0
+        batches[-1].append(arg)
+        size += arg_size
+    return batches
+
+def _decode_output(data):
+    """Decode raw subprocess output the way text mode would, tolerating invalid UTF-8"""
+    return data.decode('utf-8', 'replace').replace('\r\n', '\n')
+
+def _json_dumps(obj):
+    """Serialize obj to a JSON string, with orjson if available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj)
+
+def _iter_compile_commands(path):
+    """Yield the entries of a compile_commands.json file
+
+    Entries are streamed with ijson when it is installed, so the whole
+    database never has to be held in memory. Otherwise the file is parsed at
+    once, with orjson if available.
+    """
+    with open(path, 'rb') as f:
+        if IJSON_AVAILABLE:
+            yield from ijson.items(f, 'item')
+        elif ORJSON_AVAILABLE:
+            yield from orjson.loads(f.read())
+        else:
+            yield from json.load(f)
+
+def _normalize_exclude_path(path):
+    """Normalize a path or pattern for exclusion matching (forward slashes, no ./ or //)"""
+    path = path.replace('\\', '/')
+    if path.startswith('./'):
+        path = path[2:]
+    while '//' in path:
+        path = path.replace('//', '/')
+    return path
+
+def _glob_to_regex(pattern, within_component=False):
+    """Translate a glob into an unanchored regex fragment, like fnmatch.translate.
+
+    With within_component, wildcards never match '/' (used for patterns that are
+    compared against a single path component).
+    """
+    any_char = '[^/]' if within_component else '.'
+    i, n = 0, len(pattern)
+    parts = []
+    while i < n:
+        c = pattern[i]
+        i += 1
+        if c == '*':
+            parts.append(any_char + '*')
+        elif c == '?':
+            parts.append(any_char)
+        elif c == '[':
+            j = i
+            if j < n and pattern[j] == '!':
+                j += 1
+            if j < n and pattern[j] == ']':
+                j += 1
+            while j < n and pattern[j] != ']':
+                j += 1
+            if j >= n:
+                parts.append('\\[')
+            else:
+                stuff = pattern[i:j].replace('\\', '\\\\')
+                i = j + 1
+                if stuff[0] == '!':
+                    stuff = '^' + ('/' if within_component else '') + stuff[1:]
+                elif stuff[0] == '^':
+                    stuff = '\\' + stuff
+                parts.append('[' + stuff + ']')
+        else:
+            parts.append(re.escape(c))
+    return ''.join(parts)
+
+# Shapes of --exclude patterns, as reported by --debug-exclude
+EXCLUDE_PLAIN = 'plain'          # "*.tmp", "tests/*"
+EXCLUDE_ALL = 'all'              # "**"
+EXCLUDE_ANY_DEPTH = 'any-depth'  # "**/test", "**/*_test.cpp"
+EXCLUDE_DIRECTORY = 'directory'  # "external/**"
+EXCLUDE_MIDDLE = 'middle'        # "src/**/test.cpp"
+
+def _exclude_pattern_regex(pattern):
+    """Translate an --exclude pattern into a regex to search a normalized path with.
+
+    Returns (kind, regex), or None for patterns that can never match.
+    """
+    pattern = _normalize_exclude_path(pattern)
+    if pattern.endswith('**/'):
+        pattern = pattern[:-1]  # "dir/**/" means the same as "dir/**"
+    if not pattern:
+        return None
+    if '**' not in pattern:
+        # Direct glob match against the whole path
+        kind = EXCLUDE_PLAIN
+        alternatives = ['^' + _glob_to_regex(pattern) + r'\Z']
+        if '*' in pattern and '/' not in pattern:
+            # Patterns like "*.test.cpp" also match just the filename
+            alternatives.append('(?:^|/)' + _glob_to_regex(pattern, True) + r'\Z')
+        if pattern.endswith('/*'):
+            # Patterns like "tests/*" also match anything under a matching parent directory
+            alternatives.append('^' + _glob_to_regex(pattern[:-2]) + r'(?:/|\Z)')
+    elif pattern == '**':
+        return EXCLUDE_ALL, '^'
+    elif pattern.startswith('**/') and '**' not in pattern[3:]:
+        # Patterns like "**/test" match a trailing subpath or a single component anywhere
+        kind = EXCLUDE_ANY_DEPTH
+        search_pattern = pattern[3:]
+        alternatives = ['(?:^|/)' + _glob_to_regex(search_pattern) + r'\Z']
+        if '/' not in search_pattern:
+            alternatives.append('(?:^|/)' + _glob_to_regex(search_pattern, True) + r'(?:/|\Z)')
+    elif pattern.endswith('/**') and '**' not in pattern[:-3]:
+        # Patterns like "external/**" match a directory (anywhere in the path) and everything under it
+        kind = EXCLUDE_DIRECTORY
+        alternatives = ['(?:^|/)' + _glob_to_regex(pattern[:-3], True) + r'(?:/|\Z)']
+    else:
+        # Patterns like "src/**/test.cpp": each "/**/" spans any number of
+        # directories, a trailing "/**" everything below, any other "**" anything
+        kind = EXCLUDE_MIDDLE
+        suffix = r'\Z'
+        if pattern.startswith('**/'):
+            pattern = pattern[3:]
+        if pattern.endswith('/**'):
+            pattern, suffix = pattern[:-3], r'(?:/|\Z)'
+        pieces = ['.*'.join(_glob_to_regex(part) for part in piece.split('**'))
+                  for piece in pattern.split('/**/')]
+        alternatives = ['(?:^|/)' + '/(?:.*/)?'.join(pieces) + suffix]
+    return kind, '|'.join(alternatives)
+
+def _compile_exclude_matchers(patterns):
+    """Compile each exclude pattern once, as (pattern, kind, regex) tuples"""
+    matchers = []
+    for pattern in patterns:
+        translated = _exclude_pattern_regex(pattern)
+        if translated is not None:
+            kind, regex = translated
+            matchers.append((pattern, kind, re.compile(regex, re.DOTALL)))
+    return matchers
+
+def _compile_exclude_patterns(patterns):
+    """Compile exclude patterns into one regex matching if any pattern matches"""
+    regexes = [t[1] for t in (_exclude_pattern_regex(p) for p in patterns) if t is not None]
+    if not regexes:
+        return None
+    return re.compile('|'.join(f'(?:{r})' for r in regexes), re.DOTALL)
+
 class ProgressBar:
     """Simple progress bar implementation for when tqdm is not available"""
     def __init__(self, total, desc="", width=50):
@@ -45,9 +375,16 @@ class ProgressBar:
         self.width = width
         self.current = 0
         self.start_time = time.time()
+        self._last_paint = 0.0  # Monotonic time of the last redraw
+        self._painted = 0  # Count shown by the last redraw
         
     def update(self, n=1):
         self.current += n
+        # Redraw at most ~10 times per second, but always show completion
+        now = time.monotonic()
+        if now - self._last_paint < 0.1 and self.current < self.total:
+            return
+        self._last_paint = now
         self._display()
         
     def _display(self):
@@ -67,33 +404,266 @@ class ProgressBar:
             
         sys.stdout.write(f'\r{self.desc}: |{bar}| {self.current}/{self.total} ({percentage:.1%}) {eta_str}')
         sys.stdout.flush()
+        self._painted = self.current
         
     def close(self):
+        # Make sure the final state is shown even if the last update was throttled
+        if self._painted != self.current:
+            self._display()
         sys.stdout.write('\n')
         sys.stdout.flush()
 
+# Static <style> block of the per-file HTML pages
+_FILE_REPORT_STYLE = """    <style>
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+            margin: 0;
+            padding: 20px;
+            background-color: #f5f5f5;
+        }
+        .container {
+            max-width: 1200px;
+            margin: 0 auto;
+            background-color: white;
+            padding: 30px;
+            border-radius: 8px;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        }
+        .back-link {
+            display: inline-block;
+            margin-bottom: 20px;
+            color: #007bff;
+            text-decoration: none;
+        }
+        .back-link:hover {
+            text-decoration: underline;
+        }
+        .summary {
+            background-color: #f8f9fa;
+            padding: 20px;
+            border-radius: 8px;
+            margin-bottom: 20px;
+        }
+        .warning {
+            background-color: #fff3cd;
+            border-left: 4px solid #ffc107;
+            padding: 15px;
+            margin: 10px 0;
+            border-radius: 4px;
+        }
+        .error {
+            background-color: #f8d7da;
+            border-left: 4px solid #dc3545;
+            padding: 15px;
+            margin: 10px 0;
+            border-radius: 4px;
+        }
+        .location {
+            color: #6c757d;
+            font-size: 14px;
+            margin-bottom: 5px;
+            font-family: monospace;
+        }
+        .message {
+            color: #212529;
+            margin: 5px 0;
+        }
+        .check-name {
+            color: #0066cc;
+            font-size: 12px;
+            font-family: monospace;
+            background-color: #e9ecef;
+            padding: 2px 6px;
+            border-radius: 3px;
+            display: inline-block;
+            margin-top: 5px;
+        }
+        .line-group {
+            margin: 20px 0;
+            padding: 15px;
+            background-color: #f8f9fa;
+            border-radius: 8px;
+        }
+        .line-header {
+            font-weight: bold;
+            margin-bottom: 10px;
+            color: #495057;
+        }
+    </style>
+"""
+
+def _write_single_file_report(output_file, display_path, warnings, main_report, error_count, warning_count):
+    """Generate HTML report for a single file
+
+    Module-level so that _generate_file_reports can run it in worker processes.
+    """
+    parts = [f"""<!DOCTYPE html>
+<html>
+<head>
+    <title>Clang-Tidy Report - {_escape_html(display_path)}</title>
+    <meta charset="UTF-8">
+""", _FILE_REPORT_STYLE, f"""</head>
+<body>
+    <div class="container">
+        <a href="{os.path.basename(main_report)}" class="back-link">← Back to Summary</a>
+        
+        <h1>📄 {_escape_html(display_path)}</h1>
+        
+        <div class="summary">
+            <strong>Total Issues:</strong> {len(warnings)} 
+            (<span style="color: #dc3545;">{error_count} errors</span>, 
+            <span style="color: #ffc107;">{warning_count} warnings</span>)
+        </div>
+        
+        <h2>Issues</h2>
+"""]
+    
+    # Group warnings by line for better readability
+    warnings_by_line = defaultdict(list)
+    for w in warnings:
+        warnings_by_line[w['line']].append(w)
+    
+    # Sort by line number
+    for line_num in sorted(warnings_by_line.keys()):
+        line_warnings = warnings_by_line[line_num]
+        
+        parts.append(f"""
+        <div class="line-group">
+            <div class="line-header">Line {line_num}</div>
+""")
+        
+        for w in sorted(line_warnings, key=itemgetter('column')):
+            parts.append(_FILE_DETAIL_TMPL.format_map(dict(w, message_esc=_escape_html(w['message']))))
+        
+        parts.append("</div>")
+    
+    parts.append("""
+    </div>
+</body>
+</html>
+""")
+    
+    # Pages are small: join them and hand the text to the OS in one write
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write(''.join(parts))
+
+def _write_single_markdown_file_report(output_file, display_path, warnings, main_report_link,
+                                       error_count, warning_count, note_count):
+    """Generate Markdown report for a single file
+
+    Module-level so that _generate_markdown_file_reports can run it in worker processes.
+    """
+    parts = [f"""# Clang-Tidy Report - File Details
+
+[← Back to Summary](./{main_report_link})
+
+## 📄 `{display_path}`
+
+**Generated on:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+
+### Summary
+
+- **Total Issues:** {len(warnings)}
+- **Errors:** {error_count}
+- **Warnings:** {warning_count}
+- **Notes:** {note_count}
+
+### Issues by Type
+
+"""]
+    
+    # Count issues by check type for this file
+    file_check_counts = Counter(map(itemgetter('check'), warnings))
+    
+    sorted_file_checks = sorted(file_check_counts.items(), key=itemgetter(1), reverse=True)
+    
+    if sorted_file_checks:
+        parts.append("| Check | Count |\n")
+        parts.append("|-------|-------|\n")
+        for check, count in sorted_file_checks[:10]:
+            parts.append(f"| `{check}` | {count} |\n")
+        
+        if len(sorted_file_checks) > 10:
+            parts.append(f"\n*... and {len(sorted_file_checks) - 10} more check types*\n")
+    
+    parts.append("\n### Detailed Issues\n\n")
+    
+    # Group warnings by line for better readability
+    warnings_by_line = defaultdict(list)
+    for w in warnings:
+        warnings_by_line[w['line']].append(w)
+    
+    # Sort by line number
+    for line_num in sorted(warnings_by_line.keys()):
+        line_warnings = warnings_by_line[line_num]
+        
+        parts.append(f"#### Line {line_num}\n\n")
+        
+        for w in sorted(line_warnings, key=itemgetter('column')):
+            severity_icon = {
+                'error': '❌',
+                'warning': '⚠️',
+                'note': 'ℹ️'
+            }.get(w['severity'], '•')
+            
+            parts.append(f"{severity_icon} **Column {w['column']}** - {w['severity'].capitalize()}\n")
+            parts.append(f"   - {w['message']}\n")
+            parts.append(f"   - Check: `{w['check']}`\n\n")
+    
+    # Add navigation
+    parts.append("\n---\n")
+    parts.append(f"[← Back to Summary](./{main_report_link})\n")
+    
+    # Pages are small: join them and hand the text to the OS in one write
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write(''.join(parts))
+
 class ClangTidyReporter:
-    def __init__(self, build_dir, print_mode=PrintMode.PROGRESS, output_dir=None, exclude_patterns=None, debug_exclude=False, header_filter=None, project_dir=None, debug_parsing=False, save_raw_output=False):
+    # One diagnostic line: file:line:column: severity: message [check]
+    _DIAG_RE = re.compile(r'^(.+?):(\d+):(\d+): (warning|error|note): (.+?) \[([^\]]+)\]$', re.MULTILINE)
+    # Occurrences counted as issues in console output
+    _COUNT_RE = re.compile(r'(warning|error):')
+    # Whole output lines shown in verbose mode
+    _PRINT_RE = re.compile(r'^[^\n]*(?:warning|error|note):[^\n]*$', re.MULTILINE)
+    # Known failure causes in clang-tidy's stderr, all found in one scan
+    _STDERR_PROBLEM_RE = re.compile(r'(?P<no_database>error: no compilation database found)'
+                                    r'|(?P<not_found>error: unable to find)'
+                                    r'|(?P<llvm>LLVM ERROR)')
+    
+    def __init__(self, build_dir, print_mode=PrintMode.PROGRESS, output_dir=None, exclude_patterns=None, debug_exclude=False, header_filter=None, project_dir=None, debug_parsing=False, save_raw_output=False, jobs=None, batch_size=1, cache_dir=None):
         self.build_dir = build_dir
+        self.cache_dir = os.path.expanduser(cache_dir) if cache_dir else None  # Result cache, None if disabled
+        self._compile_entries = {}  # compile_commands entry per file, only kept for the cache
+        self._config_contents = {}  # .clang-tidy files applying to each directory
+        self._clang_tidy_version = ''
+        self._config_file = self._find_clang_tidy_config()  # Resolved once, reused for every file
         self.warnings = []
         self.warnings_set = set()  # Track unique warnings to avoid duplicates
+        self.warnings_by_file = defaultdict(list)  # Same warnings grouped by file
+        self._report_counts_cache = None  # See _report_counts
+        self._report_counts_size = 0  # len(self.warnings) when _report_counts_cache was built
         self.print_mode = print_mode
         self.output_dir = output_dir or '.'
         self.exclude_patterns = exclude_patterns or []
+        self._exclude_re = _compile_exclude_patterns(self.exclude_patterns)  # All patterns in one regex
+        self._exclude_matchers = _compile_exclude_matchers(self.exclude_patterns)  # Per-pattern regexes
+        self._exclude_cache = {}  # Exclusion decision per diagnostic file path
         self.debug_exclude = debug_exclude
         self.debug_parsing = debug_parsing  # New: debug parsing flag
         self.save_raw_output = save_raw_output  # New: save raw output flag
+        self.jobs = jobs or _default_jobs()  # Number of concurrent clang-tidy processes
+        self.batch_size = max(1, batch_size or 1)  # Files per clang-tidy invocation
         self.header_filter = header_filter  # New: header filter pattern
         self.project_dir = os.path.abspath(project_dir) if project_dir else None  # New: project directory
         self.files_to_check = []  # Initialize before loading
         self.current_file = ""
         self.files_processed = 0
-        self.file_warnings = defaultdict(int)  # Track warnings per file
         self.checks_used = None  # Track which checks were used
         self.config_file_used = None  # Track if config file was used
         self.raw_outputs = []  # Store raw outputs for debugging
         self.last_command = None  # Store last clang-tidy command
-        self.compile_commands = self._load_compile_commands()  # This will populate files_to_check
+        self.total_files = self._load_compile_commands()  # This will populate files_to_check
+        self._included_files = set(self.files_to_check)  # Already passed the exclude patterns
         
         # Create output directory if it doesn't exist
         if self.output_dir != '.':
@@ -111,19 +681,7 @@ class ClangTidyReporter:
         
     def _get_display_path(self, file_path):
         """Get display path - relative to project dir if specified, otherwise try relative to cwd"""
-        if self.project_dir:
-            try:
-                abs_path = os.path.abspath(file_path)
-                if abs_path.startswith(self.project_dir):
-                    return os.path.relpath(abs_path, self.project_dir)
-            except:
-                pass
-        
-        # Fall back to relative path from cwd
-        try:
-            return os.path.relpath(file_path)
-        except:
-            return file_path
+        return _display_path(file_path, self.project_dir)
     
     def _print_stage(self, stage, status="STARTED"):
         """Print a stage marker"""
@@ -138,63 +696,66 @@ class ClangTidyReporter:
         elif status == "FAILED":
             print(f"[{timestamp}] ✗ {stage}")
     
+    @property
+    def file_warnings(self):
+        """Number of warnings per file (cached along with the other report counts)"""
+        return self._report_counts()[3]
+    
+    def _report_counts(self):
+        """Severity, per-file severity, check and per-file counts shared by all report formats
+
+        Built in one pass over the warnings, and rebuilt only after new
+        warnings were added.
+        """
+        if self._report_counts_cache is None or self._report_counts_size != len(self.warnings):
+            severity_counts = Counter()
+            file_severity_counts = defaultdict(Counter)
+            check_counts = Counter()
+            for w in self.warnings:
+                severity_counts[w['severity']] += 1
+                file_severity_counts[w['file']][w['severity']] += 1
+                check_counts[w['check']] += 1
+            file_counts = Counter({file_path: len(file_warnings)
+                                   for file_path, file_warnings in self.warnings_by_file.items()})
+            self._report_counts_cache = (severity_counts, file_severity_counts, check_counts, file_counts)
+            self._report_counts_size = len(self.warnings)
+        return self._report_counts_cache
+    
+    def _severity_counts(self):
+        """Number of warnings per severity"""
+        return self._report_counts()[0]
+    
+    def _filter_changed_files_via_ccache(self, log_path):
+        """Keep only the files that missed the ccache cache in the given ccache log
+
+        Returns the number of files dropped.
+        """
+        working_dirs = {}
+        sources = {}
+        changed = set()
+        with open(log_path, encoding='utf-8', errors='replace') as f:
+            for line in f:
+                match = CCACHE_LOG_RE.match(line.rstrip('\n'))
+                if not match:
+                    continue
+                pid, field, value = match.groups()
+                if field == 'Working directory':
+                    working_dirs[pid] = value
+                elif field == 'Source file':
+                    sources[pid] = os.path.join(working_dirs.get(pid, ''), value)
+                elif 'miss' in value and pid in sources:
+                    changed.add(os.path.realpath(sources[pid]))
+        
+        original_count = len(self.files_to_check)
+        self.files_to_check = [f for f in self.files_to_check if os.path.realpath(f) in changed]
+        return original_count - len(self.files_to_check)
+    
     def _get_output_path(self, filename):
         """Get the full path for an output file"""
         return os.path.join(self.output_dir, filename)
     
-    def _should_exclude(self, file_path):
-        """Check if file should be excluded based on patterns"""
-        # Normalize path for comparison
-        normalized_path = os.path.normpath(file_path).replace('\\', '/')
-        
-        for pattern in self.exclude_patterns:
-            # Normalize pattern
-            pattern = pattern.replace('\\', '/')
-            
-            # Handle ** glob pattern
-            if '**' in pattern:
-                # Convert ** to a more flexible pattern
-                # For "external/**", we want to match any path containing "/external/" or starting with "external/"
-                if pattern.startswith('**/'):
-                    # Pattern like "**/test" - match anywhere
-                    search_pattern = pattern[3:]  # Remove **/
-                    if '**' in search_pattern:
-                        # Handle nested ** patterns
-                        regex_pattern = search_pattern.replace('**', '.*').replace('*', '[^/]*')
-                    else:
-                        regex_pattern = search_pattern.replace('*', '[^/]*')
-                    
-                    # Check if pattern appears anywhere in the path
-                    if re.search(regex_pattern, normalized_path):
-                        return True
-                elif pattern.endswith('/**'):
-                    # Pattern like "external/**" - match directory and everything under it
-                    dir_pattern = pattern[:-3]  # Remove /**
-                    # Check if path contains this directory
-                    # Match /external/ or starts with external/
-                    if f"/{dir_pattern}/" in normalized_path or normalized_path.startswith(f"{dir_pattern}/"):
-                        return True
-                else:
-                    # Pattern with ** in the middle like "src/**/test"
-                    regex_pattern = pattern.replace('**', '.*').replace('*', '[^/]*')
-                    # Allow pattern to match anywhere in the path
-                    if re.search(regex_pattern, normalized_path):
-                        return True
-            else:
-                # Use standard glob matching
-                if fnmatch.fnmatch(normalized_path, pattern):
-                    return True
-                
-                # For patterns like "*.test.cpp", check just the filename
-                if '*' in pattern and '/' not in pattern:
-                    filename = os.path.basename(normalized_path)
-                    if fnmatch.fnmatch(filename, pattern):
-                        return True
-        
-        return False
-            
     def _load_compile_commands(self):
-        """Load compile_commands.json"""
+        """Load compile_commands.json and return the number of files it lists"""
         self._print_stage("Loading compile_commands.json")
         compile_commands_path = Path(self.build_dir) / "compile_commands.json"
         if not compile_commands_path.exists():
@@ -202,11 +763,14 @@ class ClangTidyReporter:
             print(f"Error: {compile_commands_path} not found!")
             sys.exit(1)
             
-        with open(compile_commands_path) as f:
-            commands = json.load(f)
+        commands = _iter_compile_commands(compile_commands_path)
         
         # Extract and normalize file paths
-        all_files = []
+        total_files = 0
+        excluded_count = 0
+        excluded_counts = defaultdict(int)  # Number of files excluded by each pattern
+        # The excluded paths themselves are only listed in verbose output
+        keep_excluded = self.print_mode in [PrintMode.VERBOSE, PrintMode.FULL]
         excluded_files = []
         excluded_by_pattern = defaultdict(list)  # Track which pattern excluded which files
         
@@ -218,6 +782,8 @@ class ClangTidyReporter:
         
         debug_count = 0
         debug_exclude_active = self.debug_exclude  # Local variable to control debug output
+        # Bound once, so the loop costs nothing per file without exclude patterns
+        exclude_search = self._exclude_re.search if self._exclude_re is not None else None
         
         for cmd in commands:
             file_path = cmd['file']
@@ -228,50 +794,59 @@ class ClangTidyReporter:
             file_path = os.path.normpath(file_path)
             
             # Temporarily control debug output
-            self.debug_exclude = debug_exclude_active and len(all_files) < 20
+            if debug_exclude_active:
+                self.debug_exclude = total_files < 20
             
             # Check exclusion patterns
             excluded = False
             matched_pattern = None
-            for pattern in self.exclude_patterns:
-                if self._should_exclude_with_pattern(file_path, pattern):
-                    excluded_files.append(file_path)
-                    excluded_by_pattern[pattern].append(file_path)
-                    excluded = True
-                    matched_pattern = pattern
-                    break
+            # One search against the combined regex; only excluded files (or debug
+            # output) need the per-pattern loop to find which pattern matched
+            if exclude_search is not None or self.debug_exclude:
+                normalized_path = _normalize_exclude_path(file_path)
+                if self.debug_exclude or exclude_search(normalized_path):
+                    matched_pattern = self._matching_exclude_pattern(normalized_path)
+                    if matched_pattern is not None:
+                        excluded_count += 1
+                        excluded_counts[matched_pattern] += 1
+                        if keep_excluded:
+                            excluded_files.append(file_path)
+                            excluded_by_pattern[matched_pattern].append(file_path)
+                        excluded = True
             
             if not excluded:
                 self.files_to_check.append(file_path)
+                if self.cache_dir:
+                    self._compile_entries[file_path] = cmd
                 # Show first few files that will be processed in debug mode
                 if debug_exclude_active and debug_count < 5:
                     debug_count += 1
                     print(f"    ✓ Will process: {self._get_display_path(file_path)}")
-            elif debug_exclude_active and len(excluded_files) <= 5:
+            elif debug_exclude_active and excluded_count <= 5:
                 # Show first few excluded files with the pattern that matched
                 print(f"    ✗ Excluded by '{matched_pattern}': {self._get_display_path(file_path)}")
             
-            all_files.append(file_path)
+            total_files += 1
             
             # Limit debug output
-            if debug_exclude_active and len(all_files) == 20:
+            if debug_exclude_active and total_files == 20:
                 print("  " + "-" * 60)
                 print("  (Debug output limited to first 20 files)")
-                print(f"  So far: {len(self.files_to_check)} included, {len(excluded_files)} excluded")
+                print(f"  So far: {len(self.files_to_check)} included, {excluded_count} excluded")
         
         # Restore original debug_exclude value
         self.debug_exclude = debug_exclude_active
             
-        self._print_stage(f"Loading compile_commands.json - Found {len(all_files)} files", "COMPLETED")
+        self._print_stage(f"Loading compile_commands.json - Found {total_files} files", "COMPLETED")
         
-        if excluded_files:
-            print(f"  Excluded {len(excluded_files)} files based on exclusion patterns")
+        if excluded_count:
+            print(f"  Excluded {excluded_count} files based on exclusion patterns")
             
             # Always show exclusion summary by pattern (not just in verbose mode)
             if self.exclude_patterns:
                 print("\n  Exclusion summary by pattern:")
                 for pattern in self.exclude_patterns:
-                    count = len(excluded_by_pattern.get(pattern, []))
+                    count = excluded_counts.get(pattern, 0)
                     if count > 0:
                         print(f"    '{pattern}': {count} files")
                         # Show a few examples of excluded files for this pattern
@@ -281,8 +856,8 @@ class ClangTidyReporter:
                                 # Show project-relative path if possible
                                 display_path = self._get_display_path(example)
                                 print(f"      e.g., {display_path}")
-                            if len(excluded_by_pattern[pattern]) > 3:
-                                print(f"      ... and {len(excluded_by_pattern[pattern]) - 3} more")
+                            if count > 3:
+                                print(f"      ... and {count - 3} more")
             
             # Show detailed excluded files in verbose mode (directory grouping)
             if self.print_mode in [PrintMode.VERBOSE, PrintMode.FULL] and len(excluded_files) > 10:
@@ -294,7 +869,7 @@ class ClangTidyReporter:
                     excluded_dirs[dir_path].append(os.path.basename(file_path))
                 
                 # Sort directories by path to group related directories together
-                sorted_dirs = sorted(excluded_dirs.items(), key=lambda x: x[0])
+                sorted_dirs = sorted(excluded_dirs.items(), key=itemgetter(0))
                 
                 # Show directories with proper grouping
                 shown_dirs = 0
@@ -328,159 +903,45 @@ class ClangTidyReporter:
             if len(self.files_to_check) > 1:
                 print(f"  Last file to analyze: {self._get_display_path(self.files_to_check[-1])}")
         
-        return commands
-    
-    def _should_exclude_with_pattern(self, file_path, pattern):
-        """Check if file should be excluded by a specific pattern"""
-        # Normalize path for comparison - ensure forward slashes
-        normalized_path = os.path.normpath(file_path).replace('\\', '/')
-        # Remove any leading ./ 
-        if normalized_path.startswith('./'):
-            normalized_path = normalized_path[2:]
-        # Remove any duplicate slashes
-        while '//' in normalized_path:
-            normalized_path = normalized_path.replace('//', '/')
-        
-        # Normalize pattern - ensure forward slashes
-        pattern = pattern.replace('\\', '/')
-        # Remove any leading ./
-        if pattern.startswith('./'):
-            pattern = pattern[2:]
-        # Remove any duplicate slashes  
-        while '//' in pattern:
-            pattern = pattern.replace('//', '/')
-        
-        # Debug output
-        show_debug = False
-        if self.debug_exclude:
-            # Only show debug for files that might match the pattern to reduce noise
-            if '**' in pattern and pattern.endswith('/**'):
-                # For patterns like "external/**", only show if path contains the directory
-                dir_name = pattern[:-3]
-                if dir_name in normalized_path:
-                    show_debug = True
-            elif '**' not in pattern or normalized_path.count('/') <= 3:
-                show_debug = True
-            
-            if show_debug:
+        return total_files
+    
+    def _matching_exclude_pattern(self, normalized_path):
+        """Return the first exclude pattern matching a normalized path, or None"""
+        for pattern, kind, regex in self._exclude_matchers:
+            matched = regex.search(normalized_path) is not None
+            if self.debug_exclude:
                 print(f"    DEBUG: Checking '{normalized_path}' against pattern '{pattern}'")
+                if matched:
+                    print(f"      MATCHED ({kind} pattern, regex: {regex.pattern})")
+                else:
+                    print(f"      No match")
+            if matched:
+                return pattern
         
-        # Handle ** glob pattern
-        if '**' in pattern:
-            if pattern == '**':
-                # Match everything
-                return True
-            elif pattern.startswith('**/'):
-                # Pattern like "**/test" - match anywhere
-                search_pattern = pattern[3:]  # Remove **/
-                # Check if this pattern appears anywhere in the path as a complete component
-                path_parts = normalized_path.split('/')
-                for i in range(len(path_parts)):
-                    if fnmatch.fnmatch(path_parts[i], search_pattern):
-                        if show_debug:
-                            print(f"      MATCHED: Component '{path_parts[i]}' matches '{search_pattern}'")
-                        return True
-                    # Also check subpaths
-                    subpath = '/'.join(path_parts[i:])
-                    if fnmatch.fnmatch(subpath, search_pattern):
-                        if show_debug:
-                            print(f"      MATCHED: Subpath '{subpath}' matches '{search_pattern}'")
-                        return True
-            elif pattern.endswith('/**'):
-                # Pattern like "external/**" - match directory and everything under it
-                dir_pattern = pattern[:-3]  # Remove /**
-                
-                # Method 1: Check if any directory component matches the pattern
-                path_parts = normalized_path.split('/')
-                for i, part in enumerate(path_parts):
-                    if fnmatch.fnmatch(part, dir_pattern):
-                        # This directory component matches
-                        if show_debug:
-                            print(f"      MATCHED: Directory component '{part}' matches '{dir_pattern}'")
-                        return True
-                
-                # Method 2: Check if the pattern appears as a complete directory in the path
-                # This is more direct - look for /dir_pattern/ in the path
-                if f"/{dir_pattern}/" in f"/{normalized_path}/":
-                    if show_debug:
-                        print(f"      MATCHED: Path contains directory '/{dir_pattern}/'")
-                    return True
-                
-                # Method 3: Check if path starts with the pattern (for relative paths)
-                if normalized_path == dir_pattern or normalized_path.startswith(f"{dir_pattern}/"):
-                    if show_debug:
-                        print(f"      MATCHED: Path starts with '{dir_pattern}'")
-                    return True
-            else:
-                # Pattern with ** in the middle like "src/**/test.cpp"
-                # Split pattern by **
-                parts = pattern.split('**')
-                if len(parts) == 2:
-                    start_pattern, end_pattern = parts
-                    # Check if path starts with the start pattern and ends with end pattern
-                    # Remove trailing/leading slashes
-                    start_pattern = start_pattern.rstrip('/')
-                    end_pattern = end_pattern.lstrip('/')
-                    
-                    # Find if start pattern matches
-                    if start_pattern:
-                        start_found = False
-                        for i in range(len(normalized_path)):
-                            if normalized_path[:i].endswith(start_pattern):
-                                start_found = True
-                                remaining = normalized_path[i:]
-                                if not end_pattern or fnmatch.fnmatch(remaining.lstrip('/'), end_pattern):
-                                    if show_debug:
-                                        print(f"      MATCHED: Path matches pattern with ** in middle")
-                                    return True
-                    else:
-                        # No start pattern, just check if ends with end pattern
-                        if fnmatch.fnmatch(normalized_path, f"*{end_pattern}"):
-                            if show_debug:
-                                print(f"      MATCHED: Path ends with '{end_pattern}'")
-                            return True
-        else:
-            # Standard glob pattern without **
-            # Direct match
-            if fnmatch.fnmatch(normalized_path, pattern):
-                if show_debug:
-                    print(f"      MATCHED: Direct fnmatch")
-                return True
-            
-            # For patterns like "*.test.cpp", check just the filename
-            if '*' in pattern and '/' not in pattern:
-                filename = os.path.basename(normalized_path)
-                if fnmatch.fnmatch(filename, pattern):
-                    if show_debug:
-                        print(f"      MATCHED: Filename '{filename}' matches '{pattern}'")
-                    return True
-            
-            # For patterns like "tests/*", check if any parent directory matches
-            if pattern.endswith('/*'):
-                dir_pattern = pattern[:-2]
-                path_parts = normalized_path.split('/')
-                for i in range(len(path_parts)):
-                    partial_path = '/'.join(path_parts[:i+1])
-                    if fnmatch.fnmatch(partial_path, dir_pattern):
-                        if show_debug:
-                            print(f"      MATCHED: Parent directory matches '{dir_pattern}'")
-                        return True
-        
-        if show_debug:
-            print(f"      No match")
-        
-        return False
+        return None
     
     def _should_exclude(self, file_path):
         """Check if file should be excluded based on patterns"""
-        for pattern in self.exclude_patterns:
-            if self._should_exclude_with_pattern(file_path, pattern):
-                return True
-        return False
-    
-    def _parse_clang_tidy_output(self, output, current_file=None):
-        """Parse clang-tidy output into structured data"""
-        pattern = r'(.+):(\d+):(\d+): (warning|error|note): (.+) \[(.+)\]'
+        if self._exclude_re is None or file_path in self._included_files:
+            return False
+        # The same headers show up in the output of many files
+        excluded = self._exclude_cache.get(file_path)
+        if excluded is None:
+            normalized_path = _normalize_exclude_path(os.path.normpath(file_path))
+            excluded = self._exclude_re.search(normalized_path) is not None
+            self._exclude_cache[file_path] = excluded
+        return excluded
+    
+    def _parse_clang_tidy_output(self, output, current_file=None, diagnostics=None, duplicates=0):
+        """Parse clang-tidy output into structured data
+
+        diagnostics may hold matches already extracted while the output was
+        streamed, as (line, file, line, column, severity, message, check)
+        tuples, with duplicates the number of repeats already dropped from
+        them; output is then only needed for debug information.
+        """
+        if diagnostics is None:
+            diagnostics = [(m.group(0),) + m.groups() for m in self._DIAG_RE.finditer(output)]
         
         if self.debug_parsing:
             print(f"\n{'='*80}")
@@ -489,79 +950,67 @@ class ClangTidyReporter:
             print(f"Output preview (first 500 chars):\n{output[:500]}")
             print(f"{'='*80}\n")
         
-        lines_processed = 0
         warnings_found = 0
-        duplicates_skipped = 0
+        duplicates_skipped = duplicates
         excluded_skipped = 0
-        potential_warnings = 0
-        
-        for line in output.split('\n'):
-            lines_processed += 1
-            
-            # Check if line contains warning/error indicators
-            if ' warning:' in line or ' error:' in line:
-                potential_warnings += 1
-            
-            match = re.match(pattern, line)
-            if match:
-                file_path = match.group(1)
-                
+        position = 0
+        
+        for warning_key, file_path, line, column, severity, message, check in diagnostics:
+            if self.debug_parsing:
+                position = output.find(warning_key, position)
+                line_number = output.count('\n', 0, position) + 1
+                position += len(warning_key)
+                print(f"DEBUG: Found potential warning in line {line_number}:")
+                print(f"  File: {file_path}")
+                print(f"  Line: {line}, Column: {column}")
+                print(f"  Severity: {severity}")
+                print(f"  Message: {message}")
+                print(f"  Check: {check}")
+            
+            # Check if this file should be excluded
+            if self.exclude_patterns and self._should_exclude(file_path):
+                excluded_skipped += 1
                 if self.debug_parsing:
-                    print(f"DEBUG: Found potential warning in line {lines_processed}:")
-                    print(f"  File: {file_path}")
-                    print(f"  Line: {match.group(2)}, Column: {match.group(3)}")
-                    print(f"  Severity: {match.group(4)}")
-                    print(f"  Message: {match.group(5)}")
-                    print(f"  Check: {match.group(6)}")
-                
-                # Check if this file should be excluded
-                if self.exclude_patterns and self._should_exclude(file_path):
-                    excluded_skipped += 1
-                    if self.debug_parsing:
-                        print(f"  -> SKIPPED: File excluded by patterns")
-                    continue
-                
-                # Create a unique key for this warning to avoid duplicates
-                warning_key = (
-                    file_path,
-                    int(match.group(2)),  # line
-                    int(match.group(3)),  # column
-                    match.group(4),       # severity
-                    match.group(5),       # message
-                    match.group(6)        # check
-                )
-                
-                # Skip if we've already seen this exact warning
-                if warning_key in self.warnings_set:
-                    duplicates_skipped += 1
-                    if self.debug_parsing:
-                        print(f"  -> SKIPPED: Duplicate warning")
-                    continue
-                
-                self.warnings_set.add(warning_key)
-                warnings_found += 1
-                
-                warning = {
-                    'file': file_path,
-                    'line': int(match.group(2)),
-                    'column': int(match.group(3)),
-                    'severity': match.group(4),
-                    'message': match.group(5),
-                    'check': match.group(6),
-                    'timestamp': datetime.now().isoformat()
-                }
-                self.warnings.append(warning)
-                
+                    print(f"  -> SKIPPED: File excluded by patterns")
+                continue
+            
+            # The matched line already encodes file, position, severity, message
+            # and check, so it serves as the unique key for this warning
+            # Skip if we've already seen this exact warning
+            if warning_key in self.warnings_set:
+                duplicates_skipped += 1
                 if self.debug_parsing:
-                    print(f"  -> ADDED: Warning #{len(self.warnings)}")
-                
-                # Track warnings per file
-                if not (self.exclude_patterns and self._should_exclude(file_path)):
-                    self.file_warnings[file_path] += 1
+                    print(f"  -> SKIPPED: Duplicate warning")
+                continue
+            
+            self.warnings_set.add(warning_key)
+            warnings_found += 1
+            
+            # File, severity and check names repeat across many warnings, so
+            # share one string object for each distinct value
+            file_path = sys.intern(file_path)
+            warning = {
+                'file': file_path,
+                'line': int(line),
+                'column': int(column),
+                'severity': sys.intern(severity),
+                'message': message,
+                'check': sys.intern(check),
+                'timestamp': datetime.now().isoformat()
+            }
+            self.warnings.append(warning)
+            self.warnings_by_file[file_path].append(warning)
+            
+            if self.debug_parsing:
+                print(f"  -> ADDED: Warning #{len(self.warnings)}")
         
         if self.debug_parsing:
+            # Line statistics are only needed for the debug summary
+            lines = output.split('\n')
+            potential_warnings = sum(1 for line in lines if ' warning:' in line or ' error:' in line)
+            
             print(f"\nDEBUG: Parsing summary for {current_file}:")
-            print(f"  Lines processed: {lines_processed}")
+            print(f"  Lines processed: {len(lines)}")
             print(f"  Lines with warning/error keywords: {potential_warnings}")
             print(f"  Warnings matching pattern: {warnings_found}")
             print(f"  Duplicates skipped: {duplicates_skipped}")
@@ -573,8 +1022,8 @@ class ClangTidyReporter:
                 print("\n⚠️  WARNING: Found lines with 'warning:' or 'error:' but couldn't parse them!")
                 print("  This might indicate a different clang-tidy output format.")
                 print("  Sample unparsed lines:")
-                for line in output.split('\n')[:50]:
-                    if (' warning:' in line or ' error:' in line) and not re.match(pattern, line):
+                for line in lines[:50]:
+                    if (' warning:' in line or ' error:' in line) and not self._DIAG_RE.match(line):
                         print(f"    {line[:120]}...")
             
             print(f"{'='*80}\n")
@@ -596,8 +1045,8 @@ class ClangTidyReporter:
         
         return None
     
-    def _run_clang_tidy_single(self, file_path, checks=None, use_config_file=True):
-        """Run clang-tidy on a single file"""
+    def _build_cmd_prefix(self, checks=None, use_config_file=True):
+        """Build the clang-tidy command shared by every invocation, without file arguments"""
         cmd = ['clang-tidy', '-p', self.build_dir]
         
         # Add header filter if specified
@@ -605,22 +1054,17 @@ class ClangTidyReporter:
             cmd.extend(['-header-filter', self.header_filter])
         
         # Check for .clang-tidy config file
-        config_file = None
         if use_config_file:
-            config_file = self._find_clang_tidy_config()
+            config_file = self._config_file
             if config_file:
                 # When using config file, don't override checks unless explicitly specified
+                # clang-tidy will automatically use .clang-tidy if found in search path
                 if checks:
                     cmd.extend(['-checks', checks])
-                # clang-tidy will automatically use .clang-tidy if found in search path
-                if self.print_mode in [PrintMode.VERBOSE, PrintMode.FULL]:
-                    print(f"  Using .clang-tidy config from: {config_file}")
             elif not checks:
                 # No config file and no checks specified, use sensible defaults
                 default_checks = 'clang-diagnostic-*,clang-analyzer-*,google-*,modernize-*,performance-*,readability-*'
                 cmd.extend(['-checks', default_checks])
-                if self.print_mode in [PrintMode.VERBOSE, PrintMode.FULL]:
-                    print(f"  No .clang-tidy file found, using default checks")
             else:
                 # No config file, but checks specified
                 cmd.extend(['-checks', checks])
@@ -633,46 +1077,198 @@ class ClangTidyReporter:
             else:
                 cmd.extend(['-checks', checks])
         
-        cmd.append(file_path)
+        return cmd
+    
+    def _run_clang_tidy_batch(self, cmd_prefix, file_paths):
+        """Run one clang-tidy invocation over a batch of files
+
+        cmd_prefix is the command built by _build_cmd_prefix; the files are
+        appended to it. Only reads reporter state, so it is safe to call from worker threads.
+        Returns (file_paths, command, returncode, stdout, stderr, diagnostics,
+        duplicates, issue_count, cached); diagnostics are unique within this
+        run and duplicates counts the repeats dropped from them. stdout is
+        None unless the full text is needed for printing, raw output or
+        debugging. cached tells whether the result came from the result
+        cache. Recording the diagnostics is left to the caller.
+        """
+        cmd = cmd_prefix + file_paths
+        
+        # Reuse the stored result if none of the inputs of this run changed
+        cache_path = self._cache_path(cmd, file_paths) if self.cache_dir else None
+        cached = self._read_cached_result(cache_path) if cache_path else None
+        
+        # The full text is only kept when something downstream needs it
+        needs_output = (self.debug_parsing or self.save_raw_output or
+                        self.print_mode in [PrintMode.VERBOSE, PrintMode.FULL])
+        keep_output = needs_output or cache_path is not None
+        diagnostics = []
+        seen = set()  # Local to this run; the caller dedups across runs
+        duplicates = 0
+        issue_count = 0
+        
+        def scan(text):
+            nonlocal duplicates, issue_count
+            for match in self._DIAG_RE.finditer(text):
+                key = match.group(0)
+                if key in seen:
+                    duplicates += 1
+                    continue
+                seen.add(key)
+                diagnostics.append((key,) + match.groups())
+            issue_count += len(self._COUNT_RE.findall(text))
         
-        if self.debug_parsing:
-            print(f"\nDEBUG: Running command: {' '.join(cmd)}")
+        if cached is not None:
+            returncode, stdout, stderr = cached
+            scan(stdout)
+        else:
+            stdout_chunks = []
+            stderr_chunks = []
+            pending = ''
+            
+            # Stream stdout and extract diagnostics while clang-tidy is still running
+            with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True) as process:
+                # Drain stderr separately so a full pipe can't block clang-tidy
+                stderr_reader = threading.Thread(target=lambda: stderr_chunks.append(process.stderr.read()))
+                stderr_reader.start()
+                
+                while True:
+                    chunk = process.stdout.read(65536)
+                    if keep_output and chunk:
+                        stdout_chunks.append(chunk)
+                    
+                    # Only scan complete lines; carry the partial last line over
+                    text = pending + chunk
+                    if chunk:
+                        cut = text.rfind('\n') + 1
+                        text, pending = text[:cut], text[cut:]
+                    if text:
+                        scan(text)
+                    if not chunk:
+                        break
+                
+                stderr_reader.join()
+                returncode = process.wait()
+            
+            stderr = ''.join(stderr_chunks)
+            stdout = ''.join(stdout_chunks) if keep_output else None
+            # A negative return code means clang-tidy was killed by a signal
+            if cache_path and returncode >= 0:
+                self._write_cached_result(cache_path, returncode, stdout, stderr)
         
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        issue_count += len(self._COUNT_RE.findall(stderr))
+        if not needs_output:
+            stdout = None
         
-        # Store the command for diagnostic purposes
-        self.last_command = ' '.join(cmd)
+        return file_paths, ' '.join(cmd), returncode, stdout, stderr, diagnostics, duplicates, issue_count, cached is not None
+    
+    def _cache_path(self, cmd, file_paths):
+        """Path of the cached result of a clang-tidy run, or None if its inputs can't be hashed
+
+        The key covers the clang-tidy version, the full command line, and for
+        each file its compile command, its preprocessed source and every
+        .clang-tidy file that may apply to it.
+        """
+        digest = hashlib.blake2b(digest_size=32)
+        digest.update(self._clang_tidy_version.encode())
+        digest.update('\0'.join(cmd).encode())
+        for file_path in file_paths:
+            entry = self._compile_entries.get(file_path)
+            if entry is None:
+                return None
+            args = _preprocess_args(entry)
+            try:
+                result = subprocess.run(args, cwd=entry.get('directory'), capture_output=True)
+            except OSError:
+                return None
+            if result.returncode != 0:
+                return None
+            digest.update('\0'.join(args).encode())
+            digest.update(result.stdout)
+            for config_path, contents in self._clang_tidy_configs(os.path.dirname(os.path.abspath(file_path))):
+                digest.update(config_path.encode())
+                digest.update(contents)
+        key = digest.hexdigest()
+        return os.path.join(self.cache_dir, key[:2], key + '.json')
+    
+    def _clang_tidy_configs(self, directory):
+        """Return (path, contents) of the .clang-tidy files in directory and its parents"""
+        configs = self._config_contents.get(directory)
+        if configs is None:
+            config_path = os.path.join(directory, '.clang-tidy')
+            try:
+                with open(config_path, 'rb') as f:
+                    configs = ((config_path, f.read()),)
+            except OSError:
+                configs = ()
+            parent = os.path.dirname(directory)
+            if parent != directory:
+                configs += self._clang_tidy_configs(parent)
+            self._config_contents[directory] = configs
+        return configs
+    
+    def _read_cached_result(self, cache_path):
+        """Load (returncode, stdout, stderr) from the result cache, or None on a miss"""
+        try:
+            with open(cache_path, encoding='utf-8') as f:
+                cached = json.load(f)
+            return cached['returncode'], cached['stdout'], cached['stderr']
+        except (OSError, ValueError, KeyError):
+            return None
+    
+    def _write_cached_result(self, cache_path, returncode, stdout, stderr):
+        """Store the result of a clang-tidy run in the result cache"""
+        try:
+            cache_subdir = os.path.dirname(cache_path)
+            os.makedirs(cache_subdir, exist_ok=True)
+            # Write a temporary file first so other runs never read a partial result
+            with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=cache_subdir,
+                                             suffix='.tmp', delete=False) as f:
+                json.dump({'returncode': returncode, 'stdout': stdout, 'stderr': stderr}, f)
+            os.replace(f.name, cache_path)
+        except OSError:
+            pass
+    
+    def _write_raw_output(self, raw_output_file, header, output):
+        """Write one raw output file (runs on the raw output writer thread)"""
+        with open(raw_output_file, 'w') as f:
+            f.write(header)
+            f.write(output)
+    
+    def _debug_clang_tidy_result(self, command, returncode, stdout, stderr):
+        """Print debug information about a finished clang-tidy run"""
+        print(f"\nDEBUG: Running command: {command}")
         
         # Check for common errors
-        if result.returncode != 0 and self.debug_parsing:
-            print(f"DEBUG: clang-tidy returned non-zero exit code: {result.returncode}")
-            if "error: no compilation database found" in result.stderr:
+        if returncode != 0:
+            print(f"DEBUG: clang-tidy returned non-zero exit code: {returncode}")
+            problems = {m.lastgroup for m in self._STDERR_PROBLEM_RE.finditer(stderr)}
+            if 'no_database' in problems:
                 print("DEBUG: ERROR - No compilation database found!")
                 print(f"       Looking in: {self.build_dir}")
-            elif "error: unable to find" in result.stderr:
+            elif 'not_found' in problems:
                 print("DEBUG: ERROR - File not found or compilation issue")
-            elif "LLVM ERROR" in result.stderr:
+            elif 'llvm' in problems:
                 print("DEBUG: ERROR - LLVM internal error")
         
-        if self.debug_parsing:
-            print(f"DEBUG: Command exit code: {result.returncode}")
-            print(f"DEBUG: stdout length: {len(result.stdout)}")
-            print(f"DEBUG: stderr length: {len(result.stderr)}")
-            if result.stderr:
-                print(f"DEBUG: stderr preview:\n{result.stderr[:500]}")
-        
-        return result.stdout + result.stderr
+        print(f"DEBUG: Command exit code: {returncode}")
+        print(f"DEBUG: stdout length: {len(stdout)}")
+        print(f"DEBUG: stderr length: {len(stderr)}")
+        if stderr:
+            print(f"DEBUG: stderr preview:\n{stderr[:500]}")
     
-    def _print_file_output(self, file_path, output):
+    def _print_file_output(self, file_path, output, warning_count=None, extra_files=0):
         """Print clang-tidy output based on print mode"""
         if self.print_mode == PrintMode.QUIET:
             return
             
         # Count issues in output
-        warning_count = len(re.findall(r'(warning|error):', output))
+        if warning_count is None:
+            warning_count = len(self._COUNT_RE.findall(output))
         
         # Use project-relative path for display
         display_path = self._get_display_path(file_path)
+        if extra_files:
+            display_path += f" (+{extra_files} more)"
         
         if self.print_mode == PrintMode.PROGRESS:
             if warning_count > 0:
@@ -684,9 +1280,8 @@ class ClangTidyReporter:
             print(f"Issues found: {warning_count}")
             if warning_count > 0:
                 # Show just the warning/error lines
-                for line in output.split('\n'):
-                    if re.search(r'(warning|error|note):', line):
-                        print(f"  {line}")
+                for match in self._PRINT_RE.finditer(output):
+                    print(f"  {match.group(0)}")
             print(f"{'='*80}")
             
         elif self.print_mode == PrintMode.FULL:
@@ -714,10 +1309,12 @@ class ClangTidyReporter:
             print("Please install clang-tidy and ensure it's in your PATH.")
             print("Run with --test-clang-tidy for more information.")
             return 1
+        # Cached results are only valid for the same clang-tidy build
+        self._clang_tidy_version = test_result.stdout
         
         # Check for .clang-tidy config file
         if use_config_file:
-            config_file = self._find_clang_tidy_config()
+            config_file = self._config_file
             if config_file:
                 self.config_file_used = config_file
                 print(f"  Found .clang-tidy configuration: {config_file}")
@@ -744,17 +1341,11 @@ class ClangTidyReporter:
         else:
             print("  Note: Not showing warnings from header files (use --header-filter to include)")
         
-        # Check clang-tidy version if in debug mode
+        # Show clang-tidy version (from the availability check above) if in debug mode
         if self.debug_parsing:
-            try:
-                version_result = subprocess.run(['clang-tidy', '--version'], 
-                                              capture_output=True, text=True)
-                if version_result.returncode == 0:
-                    print(f"\n  Clang-tidy version:")
-                    for line in version_result.stdout.strip().split('\n'):
-                        print(f"    {line}")
-            except:
-                pass
+            print(f"\n  Clang-tidy version:")
+            for line in self._clang_tidy_version.strip().split('\n'):
+                print(f"    {line}")
         
         # Verify we have files to check
         if not self.files_to_check:
@@ -763,12 +1354,13 @@ class ClangTidyReporter:
             return 1
             
         total_files = len(self.files_to_check)
+        existing_files = _existing_files(self.files_to_check)
         
         # Check if files exist (sample check for debugging)
         if self.print_mode in [PrintMode.VERBOSE, PrintMode.FULL]:
             missing_files = []
             for f in self.files_to_check[:5]:  # Check first 5 files
-                if not os.path.exists(f):
+                if f not in existing_files:
                     missing_files.append(f)
             if missing_files:
                 print(f"Warning: Some files don't exist: {missing_files}")
@@ -781,82 +1373,146 @@ class ClangTidyReporter:
             else:
                 progress = ProgressBar(total_files, "Analyzing files")
         
-        # Process each file individually
-        all_output = []
+        # Process files concurrently; each clang-tidy run is independent
+        first_output = None
         files_processed = 0
         files_skipped = 0
+        files_duplicated = 0
+        cache_hits = 0
         
-        # Re-calculate file warnings at the end
-        self.file_warnings.clear()
-        
-        for i, file_path in enumerate(self.files_to_check):
+        files_to_run = []
+        seen_files = set()  # Real paths already queued; checks and filters are the same for all
+        for file_path in self.files_to_check:
             # Skip if file doesn't exist
-            if not os.path.exists(file_path):
+            if file_path not in existing_files:
                 if self.print_mode != PrintMode.QUIET:
                     print(f"\nWarning: File not found: {self._get_display_path(file_path)}")
                 files_skipped += 1
                 if progress:
                     progress.update(1)
                 continue
-                
-            self.current_file = os.path.basename(file_path)
-            files_processed += 1
-            
-            # Update progress description
-            if progress and TQDM_AVAILABLE:
-                progress.set_description(f"Analyzing {self.current_file}")
-            
-            # Run clang-tidy on this file
-            output = self._run_clang_tidy_single(file_path, checks, use_config_file)
-            all_output.append(output)
-            
-            # Save raw output if requested
-            if self.save_raw_output:
-                raw_output_file = self._get_output_path(f"raw_output_{files_processed}_{os.path.basename(file_path)}.txt")
-                with open(raw_output_file, 'w') as f:
-                    f.write(f"File: {file_path}\n")
-                    f.write(f"Command: clang-tidy -p {self.build_dir}")
-                    if self.header_filter:
-                        f.write(f" -header-filter '{self.header_filter}'")
-                    if checks:
-                        f.write(f" -checks '{checks}'")
-                    f.write(f" {file_path}\n")
-                    f.write(f"{'='*80}\n")
-                    f.write(output)
-                self.raw_outputs.append((file_path, raw_output_file))
-            
-            # Parse output
-            self._parse_clang_tidy_output(output, file_path)
-            
-            # Print output based on mode
-            self._print_file_output(file_path, output)
-            
-            if progress:
-                progress.update(1)
+            # Files listed more than once (or through symlinks) give the same results
+            real_path = os.path.realpath(file_path)
+            if real_path in seen_files:
+                files_duplicated += 1
+                if progress:
+                    progress.update(1)
+                continue
+            seen_files.add(real_path)
+            files_to_run.append(file_path)
+        
+        if self.print_mode in [PrintMode.VERBOSE, PrintMode.FULL]:
+            print(f"  Running up to {self.jobs} clang-tidy processes in parallel")
+            if self.batch_size > 1:
+                print(f"  Passing up to {self.batch_size} files to each clang-tidy process")
+            if self.cache_dir:
+                print(f"  Using result cache: {self.cache_dir}")
+        
+        # Everything but the file arguments is the same for every invocation
+        cmd_prefix = self._build_cmd_prefix(checks, use_config_file)
+        
+        # Several files per invocation amortize clang-tidy's startup cost
+        batches = [files_to_run[i:i + self.batch_size] for i in range(0, len(files_to_run), self.batch_size)]
+        
+        # Results are handled in submission order so that warning order, raw output
+        # numbering and console output match a serial run
+        completed = {}
+        next_index = 0
+        # Raw output files are written by a background thread so disk I/O
+        # overlaps with the clang-tidy runs
+        raw_writer = ThreadPoolExecutor(max_workers=1) if self.save_raw_output else None
+        raw_writes = []
+        with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+            futures = {executor.submit(self._run_clang_tidy_batch, cmd_prefix, batch): index
+                       for index, batch in enumerate(batches)}
+            try:
+                for future in as_completed(futures):
+                    index = futures[future]
+                    completed[index] = future.result()
+                    if progress:
+                        progress.update(len(batches[index]))
+                    
+                    while next_index in completed:
+                        file_paths, command, returncode, stdout, stderr, diagnostics, duplicates, issue_count, cached = completed.pop(next_index)
+                        next_index += 1
+                        if cached:
+                            cache_hits += 1
+                        
+                        # A batch is reported under its first file
+                        file_path = file_paths[0]
+                        self.current_file = os.path.basename(file_paths[-1])
+                        files_processed += len(file_paths)
+                        
+                        # Update progress description
+                        if progress and TQDM_AVAILABLE:
+                            progress.set_description(f"Analyzing {self.current_file}")
+                        
+                        # Store the command for diagnostic purposes
+                        self.last_command = command
+                        if self.debug_parsing:
+                            self._debug_clang_tidy_result(command, returncode, stdout, stderr)
+                        
+                        output = stdout + stderr if stdout is not None else None
+                        if first_output is None:
+                            first_output = output
+                        
+                        # Save raw output if requested
+                        if self.save_raw_output:
+                            raw_output_file = self._get_output_path(f"raw_output_{files_processed}_{os.path.basename(file_path)}.txt")
+                            header = [f"File: {' '.join(file_paths)}\n",
+                                      f"Command: clang-tidy -p {self.build_dir}"]
+                            if self.header_filter:
+                                header.append(f" -header-filter '{self.header_filter}'")
+                            if checks:
+                                header.append(f" -checks '{checks}'")
+                            header.append(f" {' '.join(file_paths)}\n")
+                            header.append(f"{'='*80}\n")
+                            raw_writes.append(raw_writer.submit(self._write_raw_output, raw_output_file, ''.join(header), output))
+                            self.raw_outputs.append((file_path, raw_output_file))
+                        
+                        # Record the diagnostics extracted by the worker
+                        self._parse_clang_tidy_output(output, file_path, diagnostics, duplicates)
+                        
+                        # Print output based on mode
+                        self._print_file_output(file_path, output, issue_count, len(file_paths) - 1)
+            except KeyboardInterrupt:
+                # Don't start clang-tidy on files that are still queued
+                for future in futures:
+                    future.cancel()
+                raise
+            finally:
+                if raw_writer:
+                    raw_writer.shutdown(wait=True)
+        
+        # Surface any error from writing the raw output files
+        for write in raw_writes:
+            write.result()
         
         if progress:
             progress.close()
         
-        # Recalculate file warnings based on unique warnings
-        for warning in self.warnings:
-            self.file_warnings[warning['file']] += 1
-        
         self._print_stage(f"Analysis complete - Processed {files_processed}/{total_files} files, Found {len(self.warnings)} total issues", "COMPLETED")
         
         if files_skipped > 0:
             print(f"  Note: {files_skipped} files were skipped (not found)")
         
+        if files_duplicated > 0:
+            print(f"  Note: {files_duplicated} duplicate entries were analyzed only once")
+        
+        if self.cache_dir and self.print_mode != PrintMode.QUIET:
+            print(f"  Result cache: reused {cache_hits} of {len(batches)} clang-tidy runs")
+        
         # If no warnings found and debug mode, save a sample analysis
         if len(self.warnings) == 0:
             if self.debug_parsing or self.save_raw_output:
                 print("\n⚠️  No warnings found! Saving diagnostic information...")
-                if len(all_output) > 0 and len(self.files_to_check) > 0:
+                if first_output is not None and len(self.files_to_check) > 0:
                     diagnostic_file = self._get_output_path("no_warnings_diagnostic.txt")
                     with open(diagnostic_file, 'w') as f:
                         f.write("No warnings found - Diagnostic Information\n")
                         f.write("="*80 + "\n")
                         f.write(f"First file analyzed: {self.files_to_check[0]}\n")
-                        f.write(f"Output length: {len(all_output[0]) if all_output else 0} characters\n")
+                        f.write(f"Output length: {len(first_output)} characters\n")
                         f.write(f"Checks used: {self.checks_used}\n")
                         f.write(f"Config file: {self.config_file_used}\n")
                         f.write(f"Header filter: {self.header_filter or 'None'}\n")
@@ -864,8 +1520,7 @@ class ClangTidyReporter:
                             f.write(f"Last clang-tidy command: {self.last_command}\n")
                         f.write("\nFirst file output:\n")
                         f.write("-"*80 + "\n")
-                        if all_output:
-                            f.write(all_output[0])
+                        f.write(first_output)
                         f.write("\n\nPossible reasons for no warnings:\n")
                         f.write("1. The code is clean (no issues)\n")
                         f.write("2. The checks are too restrictive\n")
@@ -888,25 +1543,36 @@ class ClangTidyReporter:
         total_issues = len(self.warnings)
         total_pages = (total_issues + max_issues_per_page - 1) // max_issues_per_page
         
-        # Group warnings by file
-        warnings_by_file = defaultdict(list)
-        for w in self.warnings:
-            warnings_by_file[w['file']].append(w)
+        # Warnings are already grouped by file while parsing
+        warnings_by_file = self.warnings_by_file
+        
+        # Severity and check counts are shared with the other report formats
+        severity_counts, file_severity_counts, check_counts, _ = self._report_counts()
         
         # Generate main report file
-        self._generate_html_index(output_file, warnings_by_file, total_issues)
+        self._generate_html_index(output_file, warnings_by_file, total_issues,
+                                  severity_counts, file_severity_counts, check_counts)
         
         # Generate individual file reports if there are many issues
         if total_issues > 1000:
-            self._generate_file_reports(warnings_by_file, output_file)
+            self._generate_file_reports(warnings_by_file, output_file, file_severity_counts)
         
         print(f"  ✓ HTML report saved to: {output_file}")
         if total_issues > 1000:
             print(f"    Note: Generated separate file reports due to large number of issues ({total_issues})")
     
-    def _generate_html_index(self, output_file, warnings_by_file, total_issues):
+    def _generate_html_index(self, output_file, warnings_by_file, total_issues,
+                             severity_counts, file_severity_counts, check_counts):
         """Generate the main HTML index with summary and navigation"""
-        html_content = f"""<!DOCTYPE html>
+        # Streamed straight to the file so the page is never held in memory as a whole
+        with open(output_file, 'w', encoding='utf-8', buffering=REPORT_BUFFER_SIZE) as f:
+            self._write_html_index(f.write, output_file, warnings_by_file, total_issues,
+                                   severity_counts, file_severity_counts, check_counts)
+    
+    def _write_html_index(self, write, output_file, warnings_by_file, total_issues,
+                          severity_counts, file_severity_counts, check_counts):
+        """Write the main HTML index piece by piece through write"""
+        write(f"""<!DOCTYPE html>
 <html>
 <head>
     <title>Clang-Tidy Analysis Report</title>
@@ -1078,40 +1744,40 @@ class ClangTidyReporter:
         <h1>🔍 Clang-Tidy Analysis Report</h1>
         <p>Generated on: <strong>{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</strong></p>
         <p>Build directory: <code>{self.build_dir}</code></p>
-"""
+""")
         
         # Add header filter information
         if self.header_filter:
             escaped_filter = html.escape(self.header_filter)
-            html_content += f"""
+            write(f"""
         <p>Header filter: <code>{escaped_filter}</code></p>
-"""
+""")
         
         # Add exclusion information if patterns were used
         if self.exclude_patterns:
             escaped_patterns = [html.escape(p) for p in self.exclude_patterns]
-            html_content += f"""
+            write(f"""
         <p>Excluded patterns: <code>{', '.join(escaped_patterns)}</code></p>
-"""
+""")
         
         # Add project directory information if specified
         if self.project_dir:
-            html_content += f"""
+            write(f"""
         <p>Project directory: <code>{html.escape(self.project_dir)}</code></p>
-"""
+""")
         
-        html_content += f"""
+        write(f"""
         <div class="summary">
             <div class="stat-card">
                 <div class="stat-value">{total_issues}</div>
                 <div class="stat-label">Total Issues<br><small>(duplicates removed)</small></div>
             </div>
             <div class="stat-card">
-                <div class="stat-value" style="color: #dc3545;">{len([w for w in self.warnings if w['severity'] == 'error'])}</div>
+                <div class="stat-value" style="color: #dc3545;">{severity_counts['error']}</div>
                 <div class="stat-label">Errors</div>
             </div>
             <div class="stat-card">
-                <div class="stat-value" style="color: #ffc107;">{len([w for w in self.warnings if w['severity'] == 'warning'])}</div>
+                <div class="stat-value" style="color: #ffc107;">{severity_counts['warning']}</div>
                 <div class="stat-label">Warnings</div>
             </div>
             <div class="stat-card">
@@ -1119,41 +1785,37 @@ class ClangTidyReporter:
                 <div class="stat-label">Files with Issues</div>
             </div>
         </div>
-"""
+""")
         
         # Add warning for large reports
         if total_issues > 1000:
-            html_content += f"""
+            write(f"""
         <div class="warning-box">
             <strong>⚠️ Large Report:</strong> This project has {total_issues} issues. 
             File-specific reports have been generated for better performance.
             Click on file names below to view detailed issues for each file.
         </div>
-"""
+""")
         
         # Add check type summary
-        check_counts = defaultdict(int)
-        for w in self.warnings:
-            check_counts[w['check']] += 1
+        sorted_checks = sorted(check_counts.items(), key=itemgetter(1), reverse=True)
         
-        sorted_checks = sorted(check_counts.items(), key=lambda x: x[1], reverse=True)
-        
-        html_content += """
+        write("""
         <h2>📊 Issues by Check Type</h2>
         <button class="collapsible">Show/Hide Check Types</button>
         <div class="content">
             <canvas id="checkChart"></canvas>
             <div style="margin-top: 20px;">
-"""
+""")
         
         # Add check badges
         for check, count in sorted_checks[:20]:
-            html_content += f'<span class="check-badge">{check} ({count})</span>'
+            write(f'<span class="check-badge">{check} ({count})</span>')
         
         if len(sorted_checks) > 20:
-            html_content += f'<span class="check-badge">... and {len(sorted_checks) - 20} more</span>'
+            write(f'<span class="check-badge">... and {len(sorted_checks) - 20} more</span>')
         
-        html_content += """
+        write("""
             </div>
         </div>
         
@@ -1173,73 +1835,71 @@ class ClangTidyReporter:
                 </tr>
             </thead>
             <tbody>
-"""
+""")
+        
+        # Display paths are needed for both the table and the details
+        display_paths = {file_path: self._get_display_path(file_path) for file_path in warnings_by_file}
+        # Per-file pages are linked relative to the index, see _generate_file_reports
+        file_report_prefix = f"{os.path.basename(output_file.rsplit('.', 1)[0])}_file_"
         
         # Add file entries
         for file_path, file_warnings in sorted(warnings_by_file.items(), 
                                               key=lambda x: len(x[1]), reverse=True):
-            error_count = len([w for w in file_warnings if w['severity'] == 'error'])
-            warning_count = len([w for w in file_warnings if w['severity'] == 'warning'])
+            file_severity = file_severity_counts[file_path]
+            error_count = file_severity['error']
+            warning_count = file_severity['warning']
             total_count = len(file_warnings)
             
             # Use project-relative path for display
-            display_path = self._get_display_path(file_path)
+            display_path = display_paths[file_path]
             
             # Generate file report name
             file_report = ""
             if total_issues > 1000:
-                safe_filename = file_path.replace('/', '_').replace('\\', '_').replace('.', '_')
-                safe_filename = re.sub(r'[^\w\-_]', '_', safe_filename)  # Replace any non-alphanumeric chars
-                file_report_name = f"{output_file.rsplit('.', 1)[0]}_file_{safe_filename}.html"
-                file_report = f'<a href="{os.path.basename(file_report_name)}" class="file-link">View Details</a>'
+                safe_filename = _safe_filename(file_path)
+                file_report = f'<a href="{file_report_prefix}{safe_filename}.html" class="file-link">View Details</a>'
             else:
                 file_report = f'<a href="#{self._make_anchor(file_path)}" class="file-link">Jump to Details</a>'
             
-            html_content += f"""
+            write(f"""
                 <tr>
-                    <td><code>{html.escape(display_path)}</code></td>
+                    <td><code>{_escape_html(display_path)}</code></td>
                     <td><span class="issue-count errors">{error_count}</span></td>
                     <td><span class="issue-count warnings">{warning_count}</span></td>
                     <td><strong>{total_count}</strong></td>
                     <td>{file_report}</td>
                 </tr>
-"""
+""")
         
-        html_content += """
+        write("""
             </tbody>
         </table>
-"""
+""")
         
         # Add inline details only if not too many issues
         if total_issues <= 1000:
-            html_content += """
+            write("""
         <h2>📝 Detailed Findings</h2>
-"""
+""")
             for file_path, file_warnings in sorted(warnings_by_file.items()):
-                display_path = self._get_display_path(file_path)
-                html_content += f"""
+                display_path = display_paths[file_path]
+                write(f"""
         <div id="{self._make_anchor(file_path)}" class="file-section">
-            <h3>{html.escape(display_path)}</h3>
-"""
-                for w in sorted(file_warnings, key=lambda x: (x['line'], x['column']))[:50]:  # Limit to 50 per file
-                    html_content += f"""
-            <div class="{w['severity']}" style="margin: 10px 0; padding: 10px; border-left: 4px solid;">
-                <div style="color: #6c757d; font-size: 14px;">Line {w['line']}, Column {w['column']}</div>
-                <div>{html.escape(w['message'])}</div>
-                <span class="check-badge">{w['check']}</span>
-            </div>
-"""
+            <h3>{_escape_html(display_path)}</h3>
+""")
+                for w in sorted(file_warnings, key=itemgetter('line', 'column'))[:50]:  # Limit to 50 per file
+                    write(_DETAIL_TMPL.format_map(dict(w, message_esc=_escape_html(w['message']))))
                 
                 if len(file_warnings) > 50:
-                    html_content += f"""
+                    write(f"""
             <div style="padding: 10px; background-color: #f8f9fa; border-radius: 4px;">
                 ... and {len(file_warnings) - 50} more issues in this file
             </div>
-"""
-                html_content += "</div>"
+""")
+                write("</div>")
         
         # Add JavaScript
-        html_content += """
+        write("""
     </div>
     
     <script>
@@ -1306,7 +1966,7 @@ class ClangTidyReporter:
                 tbody.appendChild(row);
             });
         }
-"""
+""")
         
         # Add chart data (limit to top 10 for performance)
         labels = []
@@ -1314,19 +1974,21 @@ class ClangTidyReporter:
         for check, count in sorted_checks[:10]:
             labels.append(check)
             values.append(count)
+        chart_json = _json_dumps({'labels': labels, 'values': values})
         
-        html_content += f"""
+        write(f"""
         // Chart data
+        var chartData = {chart_json};
         var ctx = document.getElementById('checkChart');
         if (ctx) {{
             ctx = ctx.getContext('2d');
             new Chart(ctx, {{
                 type: 'bar',
                 data: {{
-                    labels: {json.dumps(labels)},
+                    labels: chartData.labels,
                     datasets: [{{
                         label: 'Number of Issues',
-                        data: {json.dumps(values)},
+                        data: chartData.values,
                         backgroundColor: 'rgba(54, 162, 235, 0.5)',
                         borderColor: 'rgba(54, 162, 235, 1)',
                         borderWidth: 1
@@ -1346,172 +2008,58 @@ class ClangTidyReporter:
     </script>
 </body>
 </html>
-"""
-        
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+""")
     
-    def _generate_file_reports(self, warnings_by_file, base_output_file):
+    def _generate_file_reports(self, warnings_by_file, base_output_file, file_severity_counts):
         """Generate individual HTML reports for each file"""
         base_name = base_output_file.rsplit('.', 1)[0]
         
+        tasks = []
         for file_path, file_warnings in warnings_by_file.items():
             # Create a safe filename by replacing problematic characters
-            safe_filename = file_path.replace('/', '_').replace('\\', '_').replace('.', '_')
-            safe_filename = re.sub(r'[^\w\-_]', '_', safe_filename)  # Replace any non-alphanumeric chars
+            safe_filename = _safe_filename(file_path)
             file_report_name = f"{base_name}_file_{safe_filename}.html"
             
-            self._generate_single_file_report(file_report_name, file_path, file_warnings, base_output_file)
-    
-    def _generate_single_file_report(self, output_file, file_path, warnings, main_report):
-        """Generate HTML report for a single file"""
-        error_count = len([w for w in warnings if w['severity'] == 'error'])
-        warning_count = len([w for w in warnings if w['severity'] == 'warning'])
-        
-        # Use project-relative path for display
-        display_path = self._get_display_path(file_path)
-        
-        html_content = f"""<!DOCTYPE html>
-<html>
-<head>
-    <title>Clang-Tidy Report - {html.escape(display_path)}</title>
-    <meta charset="UTF-8">
-    <style>
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            margin: 0;
-            padding: 20px;
-            background-color: #f5f5f5;
-        }}
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            background-color: white;
-            padding: 30px;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        .back-link {{
-            display: inline-block;
-            margin-bottom: 20px;
-            color: #007bff;
-            text-decoration: none;
-        }}
-        .back-link:hover {{
-            text-decoration: underline;
-        }}
-        .summary {{
-            background-color: #f8f9fa;
-            padding: 20px;
-            border-radius: 8px;
-            margin-bottom: 20px;
-        }}
-        .warning {{
-            background-color: #fff3cd;
-            border-left: 4px solid #ffc107;
-            padding: 15px;
-            margin: 10px 0;
-            border-radius: 4px;
-        }}
-        .error {{
-            background-color: #f8d7da;
-            border-left: 4px solid #dc3545;
-            padding: 15px;
-            margin: 10px 0;
-            border-radius: 4px;
-        }}
-        .location {{
-            color: #6c757d;
-            font-size: 14px;
-            margin-bottom: 5px;
-            font-family: monospace;
-        }}
-        .message {{
-            color: #212529;
-            margin: 5px 0;
-        }}
-        .check-name {{
-            color: #0066cc;
-            font-size: 12px;
-            font-family: monospace;
-            background-color: #e9ecef;
-            padding: 2px 6px;
-            border-radius: 3px;
-            display: inline-block;
-            margin-top: 5px;
-        }}
-        .line-group {{
-            margin: 20px 0;
-            padding: 15px;
-            background-color: #f8f9fa;
-            border-radius: 8px;
-        }}
-        .line-header {{
-            font-weight: bold;
-            margin-bottom: 10px;
-            color: #495057;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <a href="{os.path.basename(main_report)}" class="back-link">← Back to Summary</a>
-        
-        <h1>📄 {html.escape(display_path)}</h1>
-        
-        <div class="summary">
-            <strong>Total Issues:</strong> {len(warnings)} 
-            (<span style="color: #dc3545;">{error_count} errors</span>, 
-            <span style="color: #ffc107;">{warning_count} warnings</span>)
-        </div>
-        
-        <h2>Issues</h2>
-"""
-        
-        # Group warnings by line for better readability
-        warnings_by_line = defaultdict(list)
-        for w in warnings:
-            warnings_by_line[w['line']].append(w)
-        
-        # Sort by line number
-        for line_num in sorted(warnings_by_line.keys()):
-            line_warnings = warnings_by_line[line_num]
-            
-            html_content += f"""
-        <div class="line-group">
-            <div class="line-header">Line {line_num}</div>
-"""
-            
-            for w in sorted(line_warnings, key=lambda x: x['column']):
-                html_content += f"""
-            <div class="{w['severity']}">
-                <div class="location">Column {w['column']}</div>
-                <div class="message">{html.escape(w['message'])}</div>
-                <span class="check-name">{w['check']}</span>
-            </div>
-"""
-            
-            html_content += "</div>"
+            severity_counts = file_severity_counts[file_path]
+            tasks.append((file_report_name, self._get_display_path(file_path), file_warnings,
+                          base_output_file, severity_counts['error'], severity_counts['warning']))
         
-        html_content += """
-    </div>
-</body>
-</html>
-"""
-        
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        self._write_file_reports(_write_single_file_report, tasks)
+    
+    def _write_file_reports(self, writer, tasks):
+        """Call writer with each argument tuple in tasks, one per-file report page each
+
+        Pages are independent of each other, so with more than one job and
+        enough warnings to outweigh pickling them, they are built in worker
+        processes. Workers are spawned rather than forked, so this is safe
+        whatever threads (e.g. tqdm's monitor) are running; writer must be a
+        module-level function, and the warnings of each page are pickled.
+        """
+        # Each task holds the warnings of its page third
+        warning_count = sum(len(task[2]) for task in tasks)
+        if self.jobs > 1 and len(tasks) > 1 and warning_count >= FILE_REPORT_POOL_MIN_WARNINGS:
+            with ProcessPoolExecutor(max_workers=self.jobs,
+                                     mp_context=multiprocessing.get_context('spawn')) as executor:
+                list(executor.map(writer, *zip(*tasks), chunksize=16))
+        else:
+            for task in tasks:
+                writer(*task)
     
     def _make_anchor(self, text):
         """Create a valid HTML anchor from text"""
-        return re.sub(r'[^\w\-]', '_', text)
+        return _make_anchor(text)
     
-    def generate_json_report(self, filename='clang_tidy_report.json'):
-        """Generate JSON report"""
+    def generate_json_report(self, filename='clang_tidy_report.json', indent=2):
+        """Generate JSON report
+
+        The report is indented by indent spaces, or written compactly when
+        indent is 0 or None; orjson is used when available (it only supports
+        an indent of 2).
+        """
         output_file = self._get_output_path(filename)
         
         # Calculate excluded file count
-        total_files_in_project = len(self.compile_commands) if hasattr(self, 'compile_commands') else len(self.files_to_check)
+        total_files_in_project = self.total_files
         excluded_files = total_files_in_project - len(self.files_to_check)
         
         report = {
@@ -1524,7 +2072,7 @@ class ClangTidyReporter:
                 'files_excluded': excluded_files,
                 'files_analyzed': len(self.files_to_check),
                 'total_warnings': len(self.warnings),
-                'total_errors': len([w for w in self.warnings if w['severity'] == 'error']),
+                'total_errors': self._severity_counts()['error'],
                 'checks_used': self.checks_used if hasattr(self, 'checks_used') else None,
                 'config_file_used': self.config_file_used if hasattr(self, 'config_file_used') else None,
                 'exclude_patterns': self.exclude_patterns if self.exclude_patterns else [],
@@ -1539,20 +2087,26 @@ class ClangTidyReporter:
             'warnings': self.warnings
         }
         
-        with open(output_file, 'w') as f:
-            json.dump(report, f, indent=2)
+        if ORJSON_AVAILABLE and indent in (None, 0, 2):
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2 if indent else 0))
+        else:
+            with open(output_file, 'w', buffering=REPORT_BUFFER_SIZE) as f:
+                json.dump(report, f, indent=indent or None, separators=None if indent else (',', ':'))
         
         print(f"  ✓ JSON report saved to: {output_file}")
     
     def generate_csv_report(self, filename='clang_tidy_report.csv'):
         """Generate CSV report"""
         output_file = self._get_output_path(filename)
-        with open(output_file, 'w', newline='') as f:
+        with open(output_file, 'w', newline='', buffering=REPORT_BUFFER_SIZE) as f:
             if self.warnings:
-                fieldnames = self.warnings[0].keys()
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(self.warnings)
+                # Every warning dict is built with the same keys, so rows can be
+                # extracted with a single itemgetter instead of DictWriter lookups
+                fieldnames = list(self.warnings[0].keys())
+                writer = csv.writer(f)
+                writer.writerow(fieldnames)
+                writer.writerows(map(itemgetter(*fieldnames), self.warnings))
         
         print(f"  ✓ CSV report saved to: {output_file}")
     
@@ -1563,133 +2117,155 @@ class ClangTidyReporter:
         
         total_issues = len(self.warnings)
         
-        # Group warnings by file
-        warnings_by_file = defaultdict(list)
-        for w in self.warnings:
-            warnings_by_file[w['file']].append(w)
+        # Warnings are already grouped by file while parsing
+        warnings_by_file = self.warnings_by_file
+        
+        # Severity and check counts are shared with the other report formats
+        _, file_severity_counts, check_counts, _ = self._report_counts()
         
         # Generate main report file
-        self._generate_markdown_index(output_file, warnings_by_file, total_issues)
+        self._generate_markdown_index(output_file, warnings_by_file, total_issues,
+                                      file_severity_counts, check_counts)
         
         # Generate individual file reports if there are many issues
         if total_issues > 1000:
-            self._generate_markdown_file_reports(warnings_by_file, output_file)
+            self._generate_markdown_file_reports(warnings_by_file, output_file, file_severity_counts)
         
         print(f"  ✓ Markdown report saved to: {output_file}")
         if total_issues > 1000:
             print(f"    Note: Generated separate file reports due to large number of issues ({total_issues})")
     
-    def _generate_markdown_index(self, output_file, warnings_by_file, total_issues):
+    def _generate_markdown_index(self, output_file, warnings_by_file, total_issues,
+                                 file_severity_counts, check_counts):
         """Generate the main Markdown index with summary and navigation"""
-        md = f"""# Clang-Tidy Analysis Report
+        # Streamed straight to the file so the report is never held in memory as a whole
+        with open(output_file, 'w', encoding='utf-8', buffering=REPORT_BUFFER_SIZE) as f:
+            self._write_markdown_index(f.write, output_file, warnings_by_file, total_issues,
+                                       file_severity_counts, check_counts)
+    
+    def _write_markdown_index(self, write, output_file, warnings_by_file, total_issues,
+                              file_severity_counts, check_counts):
+        """Write the main Markdown index piece by piece through write"""
+        write(f"""# Clang-Tidy Analysis Report
 
 **Generated on:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}  
 **Build Directory:** `{self.build_dir}`  
 **Output Directory:** `{self.output_dir}`  
 **Header Filter:** `{self.header_filter if self.header_filter else 'None (only source files)'}`
-"""
+""")
         
         if self.project_dir:
-            md += f"**Project Directory:** `{self.project_dir}`\n"
+            write(f"**Project Directory:** `{self.project_dir}`\n")
         
-        md += f"""
+        write(f"""
 ## Summary
 
 - **Total Issues:** {total_issues} (duplicates automatically removed)
-- **Errors:** {len([w for w in self.warnings if w['severity'] == 'error'])}
-- **Warnings:** {len([w for w in self.warnings if w['severity'] == 'warning'])}
+- **Errors:** {self._severity_counts()['error']}
+- **Warnings:** {self._severity_counts()['warning']}
 - **Files with Issues:** {len(warnings_by_file)}
-"""
+""")
         
         if self.exclude_patterns:
-            md += f"\n**Excluded Patterns:** `{', '.join(self.exclude_patterns)}`\n"
+            write(f"\n**Excluded Patterns:** `{', '.join(self.exclude_patterns)}`\n")
         
         # Add warning for large reports
         if total_issues > 1000:
-            md += f"""
+            write(f"""
 > **⚠️ Large Report:** This project has {total_issues} issues. File-specific reports have been generated for better readability.
 > Click on file names below to view detailed issues for each file.
-"""
+""")
         
         # Add check statistics
-        md += "\n## Top Issues by Check Type\n\n"
-        
-        check_counts = defaultdict(int)
-        for w in self.warnings:
-            check_counts[w['check']] += 1
+        write("\n## Top Issues by Check Type\n\n")
         
-        sorted_checks = sorted(check_counts.items(), key=lambda x: x[1], reverse=True)
+        sorted_checks = sorted(check_counts.items(), key=itemgetter(1), reverse=True)
         
         # Show top 20 in table
-        md += "| Check | Count | Percentage |\n|-------|-------|------------|\n"
+        write("| Check | Count | Percentage |\n|-------|-------|------------|\n")
         
         total = total_issues if total_issues else 1
         for check, count in sorted_checks[:20]:
             percentage = (count / total) * 100
-            md += f"| `{check}` | {count} | {percentage:.1f}% |\n"
+            write(f"| `{check}` | {count} | {percentage:.1f}% |\n")
         
         if len(sorted_checks) > 20:
-            md += f"\n*... and {len(sorted_checks) - 20} more check types*\n"
+            write(f"\n*... and {len(sorted_checks) - 20} more check types*\n")
         
         # Add file statistics
-        md += "\n## Files by Issue Count\n\n"
+        write("\n## Files by Issue Count\n\n")
+        
+        # Sort files by number of issues (descending), shared by the table and the details
+        sorted_files = sorted(warnings_by_file.items(), key=lambda x: len(x[1]), reverse=True)
+        display_paths = {file_path: self._get_display_path(file_path) for file_path in warnings_by_file}
         
         if total_issues > 1000:
             # For large reports, create a table with links to individual files
-            md += "| File | Issues | Errors | Warnings | Details |\n"
-            md += "|------|--------|--------|----------|----------|\n"
+            # (named as in _generate_markdown_file_reports, relative to the index)
+            file_report_prefix = f"{os.path.basename(output_file.rsplit('.', 1)[0])}_file_"
+            write("| File | Issues | Errors | Warnings | Details |\n")
+            write("|------|--------|--------|----------|----------|\n")
             
-            for file_path, file_warnings in sorted(warnings_by_file.items(), 
-                                                  key=lambda x: len(x[1]), reverse=True):
-                error_count = len([w for w in file_warnings if w['severity'] == 'error'])
-                warning_count = len([w for w in file_warnings if w['severity'] == 'warning'])
+            for file_path, file_warnings in sorted_files:
+                file_severity = file_severity_counts[file_path]
+                error_count = file_severity['error']
+                warning_count = file_severity['warning']
                 
                 # Use project-relative path for display
-                display_file = self._get_display_path(file_path)
+                display_file = display_paths[file_path]
+                
+                write(f"| `{display_file}` | {len(file_warnings)} | {error_count} | {warning_count} | ")
+                if len(file_warnings) < MARKDOWN_FILE_REPORT_MIN_ISSUES:
+                    write("See below |\n")
+                    continue
                 
                 # Generate file report name
-                safe_filename = file_path.replace('/', '_').replace('\\', '_').replace('.', '_')
-                safe_filename = re.sub(r'[^\w\-_]', '_', safe_filename)
-                file_report_name = f"{output_file.rsplit('.', 1)[0]}_file_{safe_filename}.md"
+                safe_filename = _safe_filename(file_path)
                 
                 # URL encode the filename for proper linking
-                link_name = urllib.parse.quote(os.path.basename(file_report_name))
+                link_name = urllib.parse.quote(f"{file_report_prefix}{safe_filename}.md")
                 
-                md += f"| `{display_file}` | {len(file_warnings)} | {error_count} | {warning_count} | "
-                md += f"[View Details](./{link_name}) |\n"
+                write(f"[View Details](./{link_name}) |\n")
+            
+            # Files without a page of their own are listed right here
+            small_files = [(file_path, file_warnings) for file_path, file_warnings in sorted_files
+                           if len(file_warnings) < MARKDOWN_FILE_REPORT_MIN_ISSUES]
+            if small_files:
+                write(f"\n## Files with Fewer than {MARKDOWN_FILE_REPORT_MIN_ISSUES} Issues\n")
+                for file_path, file_warnings in small_files:
+                    write(f"\n### `{display_paths[file_path]}`\n\n")
+                    for w in sorted(file_warnings, key=itemgetter('line', 'column')):
+                        write(f"- **Line {w['line']}, Column {w['column']}** ({w['severity']}): {w['message']} [`{w['check']}`]\n")
         else:
             # For smaller reports, just show the table without links
-            md += "| File | Issues | Errors | Warnings |\n"
-            md += "|------|--------|--------|----------|\n"
+            write("| File | Issues | Errors | Warnings |\n")
+            write("|------|--------|--------|----------|\n")
             
-            for file_path, file_warnings in sorted(warnings_by_file.items(), 
-                                                  key=lambda x: len(x[1]), reverse=True)[:50]:
-                error_count = len([w for w in file_warnings if w['severity'] == 'error'])
-                warning_count = len([w for w in file_warnings if w['severity'] == 'warning'])
+            for file_path, file_warnings in sorted_files[:50]:
+                file_severity = file_severity_counts[file_path]
+                error_count = file_severity['error']
+                warning_count = file_severity['warning']
                 
                 # Use project-relative path for display
-                display_file = self._get_display_path(file_path)
+                display_file = display_paths[file_path]
                 
-                md += f"| `{display_file}` | {len(file_warnings)} | {error_count} | {warning_count} |\n"
+                write(f"| `{display_file}` | {len(file_warnings)} | {error_count} | {warning_count} |\n")
             
             if len(warnings_by_file) > 50:
-                md += f"\n*... and {len(warnings_by_file) - 50} more files*\n"
+                write(f"\n*... and {len(warnings_by_file) - 50} more files*\n")
         
         # Add inline details only if not too many issues
         if total_issues <= 1000:
-            md += "\n## Detailed Findings\n\n"
+            write("\n## Detailed Findings\n\n")
             
             issues_shown = 0
             max_total_issues = 1000
             max_issues_per_file = 50
             
-            # Sort files by number of issues (descending)
-            sorted_files = sorted(warnings_by_file.items(), key=lambda x: len(x[1]), reverse=True)
-            
-            for file_path, file_warnings in sorted_files:
+            for index, (file_path, file_warnings) in enumerate(sorted_files):
                 if issues_shown >= max_total_issues:
-                    remaining_files = len(sorted_files) - sorted_files.index((file_path, file_warnings))
-                    md += f"\n*... and {remaining_files} more files with issues*\n"
+                    remaining_files = len(sorted_files) - index
+                    write(f"\n*... and {remaining_files} more files with issues*\n")
                     break
                     
                 # Group by severity
@@ -1698,152 +2274,85 @@ class ClangTidyReporter:
                 notes = [w for w in file_warnings if w['severity'] == 'note']
                 
                 # Use project-relative path for display
-                display_path = self._get_display_path(file_path)
+                display_path = display_paths[file_path]
                 
-                md += f"\n### `{display_path}`\n\n"
+                write(f"\n### `{display_path}`\n\n")
                 
                 file_issues_shown = 0
                 
                 if errors and file_issues_shown < max_issues_per_file:
-                    md += f"**Errors ({len(errors)}):**\n\n"
-                    for w in sorted(errors, key=lambda x: (x['line'], x['column'])):
+                    write(f"**Errors ({len(errors)}):**\n\n")
+                    for w in sorted(errors, key=itemgetter('line', 'column')):
                         if file_issues_shown >= max_issues_per_file:
-                            md += f"- ... and {len(errors) - (file_issues_shown - len(warnings) - len(notes))} more errors\n"
+                            write(f"- ... and {len(errors) - (file_issues_shown - len(warnings) - len(notes))} more errors\n")
                             break
-                        md += f"- **Line {w['line']}, Column {w['column']}**: {w['message']} [`{w['check']}`]\n"
+                        write(f"- **Line {w['line']}, Column {w['column']}**: {w['message']} [`{w['check']}`]\n")
                         issues_shown += 1
                         file_issues_shown += 1
-                    md += "\n"
+                    write("\n")
                 
                 if warnings and file_issues_shown < max_issues_per_file:
-                    md += f"**Warnings ({len(warnings)}):**\n\n"
+                    write(f"**Warnings ({len(warnings)}):**\n\n")
                     warnings_shown = 0
-                    for w in sorted(warnings, key=lambda x: (x['line'], x['column'])):
+                    for w in sorted(warnings, key=itemgetter('line', 'column')):
                         if file_issues_shown >= max_issues_per_file:
-                            md += f"- ... and {len(warnings) - warnings_shown} more warnings\n"
+                            write(f"- ... and {len(warnings) - warnings_shown} more warnings\n")
                             break
-                        md += f"- **Line {w['line']}, Column {w['column']}**: {w['message']} [`{w['check']}`]\n"
+                        write(f"- **Line {w['line']}, Column {w['column']}**: {w['message']} [`{w['check']}`]\n")
                         issues_shown += 1
                         file_issues_shown += 1
                         warnings_shown += 1
-                    md += "\n"
+                    write("\n")
                 
                 if file_issues_shown >= max_issues_per_file and (len(errors) + len(warnings) > max_issues_per_file):
                     total_remaining = len(file_warnings) - file_issues_shown
                     if total_remaining > 0:
-                        md += f"*... and {total_remaining} more issues in this file*\n\n"
-        
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(md)
+                        write(f"*... and {total_remaining} more issues in this file*\n\n")
     
-    def _generate_markdown_file_reports(self, warnings_by_file, base_output_file):
+    def _generate_markdown_file_reports(self, warnings_by_file, base_output_file, file_severity_counts):
         """Generate individual Markdown reports for each file"""
         base_name = base_output_file.rsplit('.', 1)[0]
+        # URL encode the main report filename for proper linking; the same for every page
+        main_report_link = urllib.parse.quote(os.path.basename(base_output_file))
         
+        tasks = []
         for file_path, file_warnings in warnings_by_file.items():
+            # Files with only a few issues are listed in the index instead
+            if len(file_warnings) < MARKDOWN_FILE_REPORT_MIN_ISSUES:
+                continue
+            
             # Create a safe filename by replacing problematic characters
-            safe_filename = file_path.replace('/', '_').replace('\\', '_').replace('.', '_')
-            safe_filename = re.sub(r'[^\w\-_]', '_', safe_filename)
+            safe_filename = _safe_filename(file_path)
             file_report_name = f"{base_name}_file_{safe_filename}.md"
             
-            self._generate_single_markdown_file_report(file_report_name, file_path, file_warnings, base_output_file)
-    
-    def _generate_single_markdown_file_report(self, output_file, file_path, warnings, main_report):
-        """Generate Markdown report for a single file"""
-        error_count = len([w for w in warnings if w['severity'] == 'error'])
-        warning_count = len([w for w in warnings if w['severity'] == 'warning'])
-        note_count = len([w for w in warnings if w['severity'] == 'note'])
-        
-        # Use project-relative path for display
-        display_path = self._get_display_path(file_path)
-        
-        # URL encode the main report filename for proper linking
-        main_report_link = urllib.parse.quote(os.path.basename(main_report))
-        
-        md = f"""# Clang-Tidy Report - File Details
-
-[← Back to Summary](./{main_report_link})
-
-## 📄 `{display_path}`
-
-**Generated on:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-### Summary
-
-- **Total Issues:** {len(warnings)}
-- **Errors:** {error_count}
-- **Warnings:** {warning_count}
-- **Notes:** {note_count}
-
-### Issues by Type
-
-"""
-        
-        # Count issues by check type for this file
-        file_check_counts = defaultdict(int)
-        for w in warnings:
-            file_check_counts[w['check']] += 1
-        
-        sorted_file_checks = sorted(file_check_counts.items(), key=lambda x: x[1], reverse=True)
-        
-        if sorted_file_checks:
-            md += "| Check | Count |\n"
-            md += "|-------|-------|\n"
-            for check, count in sorted_file_checks[:10]:
-                md += f"| `{check}` | {count} |\n"
-            
-            if len(sorted_file_checks) > 10:
-                md += f"\n*... and {len(sorted_file_checks) - 10} more check types*\n"
-        
-        md += "\n### Detailed Issues\n\n"
-        
-        # Group warnings by line for better readability
-        warnings_by_line = defaultdict(list)
-        for w in warnings:
-            warnings_by_line[w['line']].append(w)
+            severity_counts = file_severity_counts[file_path]
+            tasks.append((file_report_name, self._get_display_path(file_path), file_warnings, main_report_link,
+                          severity_counts['error'], severity_counts['warning'], severity_counts['note']))
         
-        # Sort by line number
-        for line_num in sorted(warnings_by_line.keys()):
-            line_warnings = warnings_by_line[line_num]
-            
-            md += f"#### Line {line_num}\n\n"
-            
-            for w in sorted(line_warnings, key=lambda x: x['column']):
-                severity_icon = {
-                    'error': '❌',
-                    'warning': '⚠️',
-                    'note': 'ℹ️'
-                }.get(w['severity'], '•')
-                
-                md += f"{severity_icon} **Column {w['column']}** - {w['severity'].capitalize()}\n"
-                md += f"   - {w['message']}\n"
-                md += f"   - Check: `{w['check']}`\n\n"
-        
-        # Add navigation
-        md += "\n---\n"
-        md += f"[← Back to Summary](./{main_report_link})\n"
-        
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(md)
+        self._write_file_reports(_write_single_markdown_file_report, tasks)
     
     def _group_by(self, key):
-        """Group warnings by a specific key"""
-        groups = defaultdict(list)
-        for w in self.warnings:
-            groups[w[key]].append(w)
-        return {k: len(v) for k, v in groups.items()}
+        """Count warnings by a specific key"""
+        if key == 'severity':
+            return self._report_counts()[0]
+        if key == 'check':
+            return self._report_counts()[2]
+        if key == 'file':
+            return self.file_warnings
+        return Counter(map(itemgetter(key), self.warnings))
     
     def generate_fix_script(self, filename='apply_fixes.sh'):
         """Generate a script to apply fixes"""
         output_file = self._get_output_path(filename)
         
         # Build the command with the same checks that were used
-        fix_cmd = f"run-clang-tidy -p {self.build_dir} -fix"
+        fix_args = ["run-clang-tidy", "-p", shlex.quote(str(self.build_dir)), "-fix"]
         if self.checks_used:
-            fix_cmd += f" -checks='{self.checks_used}'"
+            fix_args.append("-checks=" + shlex.quote(self.checks_used))
         if self.header_filter:
-            fix_cmd += f" -header-filter='{self.header_filter}'"
-        fix_cmd += " -j $(nproc)"
+            fix_args.append("-header-filter=" + shlex.quote(self.header_filter))
+        fix_args.append("-j $(nproc)")
+        fix_cmd = " ".join(fix_args)
         
         # Add note about config file if used
         config_note = ""
@@ -1871,6 +2380,7 @@ echo "Fixes applied! Check git diff to review changes."
         with open(output_file, 'w') as f:
             f.write(script)
         
+        # Also applies when the script already existed with other permissions
         os.chmod(output_file, 0o755)
         print(f"  ✓ Fix script saved to: {output_file}")
 
@@ -1880,8 +2390,9 @@ def print_summary(reporter):
     print("📊 ANALYSIS SUMMARY")
     print("="*60)
     
-    error_count = len([w for w in reporter.warnings if w['severity'] == 'error'])
-    warning_count = len([w for w in reporter.warnings if w['severity'] == 'warning'])
+    severity_counts = reporter._severity_counts()
+    error_count = severity_counts['error']
+    warning_count = severity_counts['warning']
     
     print(f"Total issues found: {len(reporter.warnings)}")
     print(f"  - Errors: {error_count}")
@@ -1898,14 +2409,15 @@ def print_summary(reporter):
     # Show header filter info
     if reporter.header_filter:
         print(f"\nHeader filter: '{reporter.header_filter}'")
-        # Count issues from header files
-        header_issues = [w for w in reporter.warnings if w['file'].endswith(('.h', '.hpp', '.hxx', '.hh'))]
+        # Count issues from header files, checking each file's extension once
+        header_issues = sum(len(file_warnings) for file_path, file_warnings in reporter.warnings_by_file.items()
+                            if os.path.splitext(file_path)[1] in HEADER_EXTENSIONS)
         if header_issues:
-            print(f"Issues from header files: {len(header_issues)}")
+            print(f"Issues from header files: {header_issues}")
     
     # Show exclusion summary if patterns were used
     if hasattr(reporter, 'exclude_patterns') and reporter.exclude_patterns:
-        total_files_in_commands = len(reporter.compile_commands) if hasattr(reporter, 'compile_commands') else 0
+        total_files_in_commands = reporter.total_files
         if total_files_in_commands > 0:
             excluded_count = total_files_in_commands - len(reporter.files_to_check)
             if excluded_count > 0:
@@ -1917,7 +2429,7 @@ def print_summary(reporter):
     # Show top 5 files with most issues
     if reporter.file_warnings:
         print("\nTop 5 files with most issues:")
-        for file, count in sorted(reporter.file_warnings.items(), key=lambda x: x[1], reverse=True)[:5]:
+        for file, count in sorted(reporter.file_warnings.items(), key=itemgetter(1), reverse=True)[:5]:
             # Use project-relative path if available
             display_file = reporter._get_display_path(file)
             print(f"  - {display_file}: {count} issues")
@@ -2293,14 +2805,25 @@ if __name__ == '__main__':
                         help='Regular expression matching header files to include in output (e.g., ".*" for all headers)')
     parser.add_argument('--format', default='all', 
                         help='Output format(s): all, json, csv, html, markdown, or comma-separated')
+    parser.add_argument('--json-indent', type=int, default=2, metavar='N',
+                        help='Indent the JSON report by N spaces, 0 for compact output (default: 2)')
     parser.add_argument('--fix', action='store_true', help='Apply fixes automatically')
     parser.add_argument('--print', choices=['quiet', 'progress', 'verbose', 'full'],
                         default='progress', help='Console print mode during analysis')
     parser.add_argument('--output', default='.', help='Output directory for report files')
     parser.add_argument('--project-dir', help='Project directory for relative path display in reports')
     parser.add_argument('--parallel', action='store_true', 
-                        help='Use parallel processing (default: 2/3 of CPU cores)')
-    parser.add_argument('--jobs', type=int, help='Number of parallel jobs (overrides default 2/3 of cores)')
+                        help='Delegate analysis to run-clang-tidy (the default mode also runs --jobs clang-tidy processes)')
+    parser.add_argument('-j', '--jobs', type=int,
+                        help='Number of clang-tidy processes to run concurrently (overrides default 2/3 of cores)')
+    parser.add_argument('--batch-size', type=int, default=1,
+                        help='Number of files passed to each clang-tidy process (default: 1)')
+    parser.add_argument('--cache', action='store_true',
+                        help='Reuse clang-tidy results for files whose preprocessed source, flags, checks and config are unchanged')
+    parser.add_argument('--ccache-log', metavar='PATH',
+                        help='Only analyze files that missed the cache in this ccache log (CCACHE_LOGFILE of the preceding build)')
+    parser.add_argument('--cache-dir', metavar='DIR',
+                        help=f'Directory for the result cache (implies --cache, default: {DEFAULT_CACHE_DIR})')
     parser.add_argument('--debug', action='store_true', help='Show debug information')
     parser.add_argument('--debug-exclude', action='store_true', help='Show detailed exclude pattern matching')
     parser.add_argument('--debug-parsing', action='store_true', help='Show detailed parsing debug information')
@@ -2345,24 +2868,20 @@ if __name__ == '__main__':
         
         # Test the path using a minimal instance
         test_reporter = type('TestReporter', (), {
-            'exclude_patterns': exclude_patterns,
             'debug_exclude': True,
-            '_should_exclude_with_pattern': ClangTidyReporter._should_exclude_with_pattern
+            '_exclude_matchers': _compile_exclude_matchers(exclude_patterns),
+            '_matching_exclude_pattern': ClangTidyReporter._matching_exclude_pattern
         })()
         
         # Test the path
-        normalized_test_path = os.path.normpath(args.test_exclude).replace('\\', '/')
+        normalized_test_path = _normalize_exclude_path(os.path.normpath(args.test_exclude))
         print(f"Normalized path: {normalized_test_path}")
         print("-" * 60)
         
-        excluded = False
-        for pattern in exclude_patterns:
-            if test_reporter._should_exclude_with_pattern(normalized_test_path, pattern):
-                print(f"\n✗ Path WOULD BE EXCLUDED by pattern '{pattern}'")
-                excluded = True
-                break
-        
-        if not excluded:
+        pattern = test_reporter._matching_exclude_pattern(normalized_test_path)
+        if pattern is not None:
+            print(f"\n✗ Path WOULD BE EXCLUDED by pattern '{pattern}'")
+        else:
             print(f"\n✓ Path WOULD BE INCLUDED (not matched by any pattern)")
         
         return 0
@@ -2381,9 +2900,21 @@ if __name__ == '__main__':
         header_filter=args.header_filter,
         project_dir=args.project_dir,
         debug_parsing=args.debug_parsing,
-        save_raw_output=args.save_raw_output
+        save_raw_output=args.save_raw_output,
+        jobs=args.jobs,
+        batch_size=args.batch_size,
+        cache_dir=args.cache_dir or (DEFAULT_CACHE_DIR if args.cache else None)
     )
     
+    # Only analyze files that were recompiled according to ccache
+    if args.ccache_log:
+        if not os.path.isfile(args.ccache_log):
+            print(f"Error: ccache log not found: {args.ccache_log}")
+            return 1
+        skipped = reporter._filter_changed_files_via_ccache(args.ccache_log)
+        print(f"Incremental mode: analyzing {len(reporter.files_to_check)} changed files "
+              f"({skipped} unchanged files skipped according to {args.ccache_log})")
+    
     # Apply file limit if specified
     if args.limit and args.limit > 0:
         original_count = len(reporter.files_to_check)
@@ -2401,7 +2932,7 @@ if __name__ == '__main__':
         print(f"Header filter: {args.header_filter if args.header_filter else 'None (source files only)'}")
         
         # Check for .clang-tidy config
-        config_file = reporter._find_clang_tidy_config()
+        config_file = reporter._config_file
         if config_file:
             print(f"\n.clang-tidy configuration found: {config_file}")
             if args.no_config:
@@ -2424,14 +2955,15 @@ if __name__ == '__main__':
             print("  'build/*'         - Excludes files directly in 'build' directory")
         
         if reporter.files_to_check:
+            present_files = _existing_files(reporter.files_to_check)
             print("\nFirst 10 files to be analyzed:")
             for i, file_path in enumerate(reporter.files_to_check[:10]):
-                exists = "✓" if os.path.exists(file_path) else "✗"
+                exists = "✓" if file_path in present_files else "✗"
                 display_path = reporter._get_display_path(file_path)
                 print(f"  {exists} {display_path}")
             
             # Check how many files actually exist
-            existing_files = sum(1 for f in reporter.files_to_check if os.path.exists(f))
+            existing_files = sum(1 for f in reporter.files_to_check if f in present_files)
             print(f"\nFiles that exist: {existing_files}/{len(reporter.files_to_check)}")
             
             if existing_files == 0:
@@ -2467,19 +2999,14 @@ if __name__ == '__main__':
             # For parallel mode, we need to filter files first
             print("Running in parallel mode...")
             
-            # Determine number of jobs
-            if args.jobs:
-                num_jobs = args.jobs
-            else:
-                # Default to 2/3 of CPU cores
-                cpu_count = multiprocessing.cpu_count()
-                num_jobs = max(1, int(cpu_count * 2 / 3))
+            # Determine number of jobs (defaults to 2/3 of available CPU cores)
+            num_jobs = reporter.jobs
             
-            print(f"  Using {num_jobs} parallel jobs (out of {multiprocessing.cpu_count()} CPU cores)")
+            print(f"  Using {num_jobs} parallel jobs (out of {_available_cpus()} available CPU cores)")
             
             # Check for .clang-tidy config
             if not args.no_config:
-                config_file = reporter._find_clang_tidy_config()
+                config_file = reporter._config_file
                 if config_file:
                     print(f"Found .clang-tidy configuration: {config_file}")
                     reporter.config_file_used = config_file
@@ -2505,106 +3032,123 @@ if __name__ == '__main__':
                 cmd.extend(['-header-filter', args.header_filter])
             cmd.extend(['-j', str(num_jobs)])
             
-            # Add files as arguments (run-clang-tidy accepts file patterns/paths)
-            # If too many files, we might hit command line limits
-            if len(reporter.files_to_check) > 500:
-                # For very large file lists, just run on all and filter output
-                print(f"  Processing {len(reporter.files_to_check)} files in parallel...")
-                print(f"  Note: Large number of files - will filter excluded files from results")
-                # Don't add file arguments, let it process all
-            else:
-                # For manageable lists, pass files directly
-                cmd.extend(reporter.files_to_check)
+            # Pass the files as arguments (run-clang-tidy accepts file patterns/paths),
+            # split over several runs when they don't fit on one command line
+            batches = _argv_batches(reporter.files_to_check, sum(len(arg) + 1 for arg in cmd))
+            if len(batches) > 1:
+                print(f"  Processing {len(reporter.files_to_check)} files in {len(batches)} run-clang-tidy runs...")
             
             # Run with real-time output parsing
             print("\n  Starting analysis...")
-            all_output = []
+            # Diagnostics are extracted as lines arrive; the full output is
+            # only kept for debug parsing, otherwise just its first characters
+            all_output = [] if reporter.debug_parsing else None
+            output_head = []
+            output_length = 0
+            diagnostics = []
+            seen_diagnostics = set()
+            duplicates = 0
             files_being_processed = set()
             last_status_lines_count = 0
+            last_redraw = 0.0  # Monotonic time of the last status redraw
             current_file = ""
             
             # Check if terminal supports ANSI escape codes
             supports_ansi = hasattr(sys.stdout, 'isatty') and sys.stdout.isatty() and os.name != 'nt'
             
+            # Loop invariants, looked up once instead of for every output line
+            show_status = reporter.print_mode != PrintMode.QUIET
+            match_diagnostic = reporter._DIAG_RE.match
+            match_file = PARALLEL_FILE_RE.match
+            
             try:
-                # Use Popen for real-time output processing
-                process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, 
-                                         text=True, bufsize=1, universal_newlines=True)
-                
-                # Parse output line by line
-                for line in process.stdout:
-                    all_output.append(line)
-                    
-                    # Look for file processing indicators in the output
-                    # run-clang-tidy output includes lines like:
-                    # "Processing file: /path/to/file.cpp"
-                    # or just the file path when running clang-tidy
-                    
-                    # Check if this line indicates a file being processed
-                    # Look for common patterns in clang-tidy output
-                    file_match = None
-                    
-                    # Pattern 1: Direct file path at start of line
-                    if line.strip() and '/' in line and not line.startswith(' '):
-                        potential_file = line.strip().split()[0]
-                        if potential_file.endswith(('.cpp', '.cc', '.cxx', '.c', '.h', '.hpp', '.hxx')):
-                            file_match = potential_file
+                return_code = 0
+                for batch in batches:
+                    # Use Popen for real-time output processing
+                    # Output is read as bytes and decoded leniently; only lines
+                    # that can matter are run through the regexes
+                    process = subprocess.Popen(cmd + batch, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
                     
-                    # Pattern 2: "Processing" or similar keywords
-                    if 'rocessing' in line or 'nalyzing' in line:
-                        # Extract file path from the line
-                        parts = line.split()
-                        for part in parts:
-                            if '/' in part and part.endswith(('.cpp', '.cc', '.cxx', '.c', '.h', '.hpp', '.hxx')):
-                                file_match = part.strip(':')
-                                break
-                    
-                    # Pattern 3: Clang-tidy warning/error output
-                    warning_match = re.match(r'^([^:]+\.(cpp|cc|cxx|c|h|hpp|hxx)):\d+:\d+:', line)
-                    if warning_match:
-                        file_match = warning_match.group(1)
-                    
-                    if file_match:
-                        # Add to set of files being processed
-                        files_being_processed.add(file_match)
-                        current_file = file_match
+                    # Parse output line by line
+                    for raw_line in process.stdout:
+                        if all_output is not None:
+                            all_output.append(raw_line)
+                        if output_length < 2000:
+                            output_head.append(raw_line)
+                        text = raw_line.decode('utf-8', 'replace')
+                        # Count characters as text mode would, with '\r\n' as one
+                        output_length += len(text) - text.endswith('\r\n')
                         
-                        # Update status display
-                        if reporter.print_mode != PrintMode.QUIET:
-                            if supports_ansi:
-                                # Move cursor up to overwrite previous status lines
-                                if last_status_lines_count > 0:
-                                    # Move up and clear lines
-                                    for _ in range(last_status_lines_count):
-                                        print('\033[1A\033[2K', end='')
-                                
-                                # Print file count on first line
-                                count_line = f"  Files analyzed: {len(files_being_processed)}"
-                                print(count_line)
-                                
-                                # Print current file on second line
-                                display_path = reporter._get_display_path(current_file)
-                                file_line = f"  Processing: {display_path}"
-                                
-                                # Truncate if too long
-                                terminal_width = 120  # Conservative terminal width
-                                if len(file_line) > terminal_width - 10:
-                                    file_line = file_line[:terminal_width-13] + "..."
-                                
-                                print(file_line, flush=True)
-                                
-                                # Remember we printed 2 lines
-                                last_status_lines_count = 2
+                        # Diagnostics need a ':' and file names a '.'
+                        has_colon = b':' in raw_line
+                        if not has_colon and b'.' not in raw_line:
+                            continue
+                        line = text.rstrip('\r\n')
+                        
+                        diagnostic = has_colon and match_diagnostic(line)
+                        if diagnostic:
+                            key = diagnostic.group(0)
+                            if key in seen_diagnostics:
+                                duplicates += 1
                             else:
-                                # Fallback for terminals without ANSI support
-                                # Print progress every 10 files to avoid too much output
-                                if len(files_being_processed) % 10 == 0:
+                                seen_diagnostics.add(key)
+                                diagnostics.append((key,) + diagnostic.groups())
+                        
+                        # Look for file processing indicators in the output
+                        # run-clang-tidy output includes lines like:
+                        # "Processing file: /path/to/file.cpp"
+                        # or just the file path when running clang-tidy
+                        
+                        # Check if this line indicates a file being processed
+                        match = match_file(line)
+                        if match:
+                            file_match = match.group(match.lastgroup)
+                            # Add to set of files being processed
+                            new_file = file_match not in files_being_processed
+                            files_being_processed.add(file_match)
+                            current_file = file_match
+                            
+                            # Update status display
+                            if show_status:
+                                if supports_ansi:
+                                    # Redraw at most ten times a second; the final count is printed below
+                                    now = time.monotonic()
+                                    if now - last_redraw < 0.1:
+                                        continue
+                                    last_redraw = now
+                                    
+                                    # Move cursor up to overwrite previous status lines
+                                    if last_status_lines_count > 0:
+                                        # Move up and clear lines
+                                        print('\033[1A\033[2K' * last_status_lines_count, end='')
+                                    
+                                    # Print file count on first line
+                                    count_line = f"  Files analyzed: {len(files_being_processed)}"
+                                    print(count_line)
+                                    
+                                    # Print current file on second line
                                     display_path = reporter._get_display_path(current_file)
-                                    print(f"  Files analyzed: {len(files_being_processed)} - Processing: {display_path}")
-                
-                # Wait for process to complete
-                process.wait()
-                return_code = process.returncode
+                                    file_line = f"  Processing: {display_path}"
+                                    
+                                    # Truncate if too long
+                                    terminal_width = 120  # Conservative terminal width
+                                    if len(file_line) > terminal_width - 10:
+                                        file_line = file_line[:terminal_width-13] + "..."
+                                    
+                                    print(file_line, flush=True)
+                                    
+                                    # Remember we printed 2 lines
+                                    last_status_lines_count = 2
+                                else:
+                                    # Fallback for terminals without ANSI support
+                                    # Print progress every 10 files to avoid too much output
+                                    if new_file and len(files_being_processed) % 10 == 0:
+                                        display_path = reporter._get_display_path(current_file)
+                                        print(f"  Files analyzed: {len(files_being_processed)} - Processing: {display_path}")
+                    
+                    # Wait for process to complete
+                    process.wait()
+                    return_code = return_code or process.returncode
                 
                 # Clear the status lines and print final count
                 if last_status_lines_count > 0 and supports_ansi:
@@ -2619,18 +3163,13 @@ if __name__ == '__main__':
                 raise
             
             # Join all output
-            full_output = ''.join(all_output)
+            full_output = _decode_output(b''.join(all_output)) if all_output is not None else None
             
             # Track initial count for duplicate detection
             initial_warnings_count = len(reporter.warnings)
             
-            # Parse output - the exclusion filtering happens in _parse_clang_tidy_output
-            reporter._parse_clang_tidy_output(full_output)
-            
-            # Recalculate file warnings based on unique warnings
-            reporter.file_warnings.clear()
-            for warning in reporter.warnings:
-                reporter.file_warnings[warning['file']] += 1
+            # Record the streamed diagnostics - the exclusion filtering happens in _parse_clang_tidy_output
+            reporter._parse_clang_tidy_output(full_output, None, diagnostics, duplicates)
             
             # Calculate how many duplicates were found
             # This is an estimate based on if we see the same warning multiple times
@@ -2650,12 +3189,12 @@ if __name__ == '__main__':
                     f.write("No warnings found in parallel mode - Diagnostic Information\n")
                     f.write("="*80 + "\n")
                     f.write(f"Files processed: {len(files_being_processed)}\n")
-                    f.write(f"Output length: {len(full_output)} characters\n")
+                    f.write(f"Output length: {output_length} characters\n")
                     f.write(f"Checks used: {reporter.checks_used}\n")
                     f.write(f"Config file: {reporter.config_file_used}\n")
                     f.write(f"\nFirst 2000 characters of output:\n")
                     f.write("-"*80 + "\n")
-                    f.write(full_output[:2000])
+                    f.write(_decode_output(b''.join(output_head)[:2000]))
                 print(f"  Diagnostic info saved to: {diagnostic_file}")
         else:
             return_code = reporter.run_analysis(
@@ -2667,7 +3206,7 @@ if __name__ == '__main__':
         # Save debug summary before generating reports
         if args.debug_parsing or args.save_raw_output or (args.debug and len(reporter.warnings) == 0):
             debug_summary_file = reporter._get_output_path("debug_summary.txt")
-            with open(debug_summary_file, 'w') as f:
+            with open(debug_summary_file, 'w', buffering=REPORT_BUFFER_SIZE) as f:
                 f.write(f"Clang-Tidy Debug Summary\n")
                 f.write(f"{'='*80}\n")
                 f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
@@ -2679,13 +3218,16 @@ if __name__ == '__main__':
                 if args.parallel and args.jobs:
                     f.write(f"Jobs: {args.jobs}\n")
                 
-                # Try to get clang-tidy version
-                try:
-                    version_result = subprocess.run(['clang-tidy', '--version'], 
-                                                  capture_output=True, text=True)
-                    f.write(f"\nClang-tidy version:\n{version_result.stdout}\n")
-                except:
-                    f.write(f"\nClang-tidy version: Unable to determine\n")
+                # Reuse the version run_analysis got from clang-tidy, otherwise ask for it
+                if reporter._clang_tidy_version:
+                    f.write(f"\nClang-tidy version:\n{reporter._clang_tidy_version}\n")
+                else:
+                    try:
+                        version_result = subprocess.run(['clang-tidy', '--version'], 
+                                                      capture_output=True, text=True)
+                        f.write(f"\nClang-tidy version:\n{version_result.stdout}\n")
+                    except:
+                        f.write(f"\nClang-tidy version: Unable to determine\n")
                 
                 # Environment info
                 f.write(f"\nEnvironment:\n")
@@ -2709,7 +3251,7 @@ if __name__ == '__main__':
                 f.write(f"Unique warnings (after deduplication): {len(reporter.warnings_set)}\n")
                 f.write(f"\n{'='*80}\n")
                 f.write(f"Warnings by file:\n")
-                for file_path, count in sorted(reporter.file_warnings.items(), key=lambda x: x[1], reverse=True):
+                for file_path, count in sorted(reporter.file_warnings.items(), key=itemgetter(1), reverse=True):
                     f.write(f"  {reporter._get_display_path(file_path)}: {count}\n")
                 f.write(f"\n{'='*80}\n")
                 f.write(f"First 10 warnings:\n")
@@ -2730,26 +3272,32 @@ if __name__ == '__main__':
             # Also save warnings to JSON for easy analysis
             if len(reporter.warnings) > 0:
                 warnings_debug_file = reporter._get_output_path("warnings_debug.json")
-                with open(warnings_debug_file, 'w') as f:
-                    json.dump({
-                        'total_warnings': len(reporter.warnings),
-                        'warnings': reporter.warnings[:100],  # First 100 warnings
-                        'file_summary': dict(reporter.file_warnings)
-                    }, f, indent=2)
+                warnings_debug = {
+                    'total_warnings': len(reporter.warnings),
+                    'warnings': reporter.warnings[:100],  # First 100 warnings
+                    'file_summary': dict(reporter.file_warnings)
+                }
+                if ORJSON_AVAILABLE:
+                    with open(warnings_debug_file, 'wb') as f:
+                        f.write(orjson.dumps(warnings_debug, option=orjson.OPT_INDENT_2))
+                else:
+                    with open(warnings_debug_file, 'w') as f:
+                        json.dump(warnings_debug, f, indent=2)
                 print(f"📝 Warnings debug data saved to: {warnings_debug_file}")
         
         # Generate reports
         reporter._print_stage(f"Generating {len(formats)} report(s): {', '.join(formats)}")
         
-        for fmt in formats:
-            if fmt == 'json':
-                reporter.generate_json_report()
-            elif fmt == 'csv':
-                reporter.generate_csv_report()
-            elif fmt == 'html':
-                reporter.generate_html_report()
-            elif fmt == 'markdown':
-                reporter.generate_markdown_report()
+        generators = {
+            'json': functools.partial(reporter.generate_json_report, indent=args.json_indent),
+            'csv': reporter.generate_csv_report,
+            'html': reporter.generate_html_report,
+            'markdown': reporter.generate_markdown_report
+        }
+        
+        # A format listed twice is only generated once
+        for fmt in dict.fromkeys(formats):
+            generators[fmt]()
         
         # Generate fix script if not fixing
         if not args.fix: